@@ -0,0 +1,47 @@
+# pylint: disable=W0621
+"""Measure the memory saved by sharing repeated parking spot values."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+from odp_amsterdam.models import ParkingSpot, SymbolTable
+from odp_amsterdam.replay import synthetic_locations
+
+
+def measure(body: str, symbols: SymbolTable | None) -> int:
+    """Return the memory retained by the parsed parking spots in bytes.
+
+    Passing None parses without any interning, as a baseline.
+    """
+    tracemalloc.start()
+    locations = [
+        ParkingSpot.from_json(item, symbols) for item in json.loads(body)["features"]
+    ]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del locations
+    return used
+
+
+def main() -> None:
+    """Compare parsing a large synthetic dataset with and without interning."""
+    count = 100_000
+    body = json.dumps(synthetic_locations(count))
+
+    # Without a table nothing is interned, every spot and regime keeps its own
+    # copy of each value as created by the JSON decoder.
+    plain = measure(body, None)
+    symbols = SymbolTable()
+    interned = measure(body, symbols)
+
+    print(f"Parking spots: {count}")
+    print(f"Without interning: {plain / 1024**2:.1f} MiB")
+    print(f"With interning: {interned / 1024**2:.1f} MiB")
+    print(f"Distinct values: {len(symbols)}")
+    print(f"Saved: {(plain - interned) / 1024**2:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,46 @@
 """Asynchronous Python client providing Open Data information of Amsterdam."""
 
+from .broadcast import (
+    BackpressurePolicy,
+    GarageBroadcaster,
+    GarageSubscription,
+    GarageUpdate,
+)
 from .exceptions import (
     ODPAmsterdamConnectionError,
     ODPAmsterdamError,
     ODPAmsterdamResultsError,
 )
-from .models import Garage, GarageCategory, ParkingSpot, VehicleType
+from .index import RegimeIndex
+from .models import (
+    Garage,
+    GarageCategory,
+    GarageSnapshot,
+    ParkingSpot,
+    Regime,
+    VehicleType,
+)
 from .odp_amsterdam import ODPAmsterdam
+from .scheduler import AdaptiveScheduler, PollStats
+from .sync import ODPAmsterdamSync
 
 __all__ = [
+    "AdaptiveScheduler",
+    "BackpressurePolicy",
     "Garage",
+    "GarageBroadcaster",
     "GarageCategory",
+    "GarageSnapshot",
+    "GarageSubscription",
+    "GarageUpdate",
     "ODPAmsterdam",
     "ODPAmsterdamConnectionError",
     "ODPAmsterdamError",
     "ODPAmsterdamResultsError",
+    "ODPAmsterdamSync",
     "ParkingSpot",
+    "PollStats",
+    "Regime",
+    "RegimeIndex",
     "VehicleType",
 ]
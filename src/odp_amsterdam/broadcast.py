@@ -0,0 +1,347 @@
+"""Share one garage poller between many subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+from .exceptions import ODPAmsterdamError
+from .models import GarageSnapshot
+
+if TYPE_CHECKING:
+    from .models import Garage
+    from .odp_amsterdam import ODPAmsterdam
+    from .scheduler import AdaptiveScheduler
+
+
+class BackpressurePolicy(enum.StrEnum):
+    """Enumeration representing what to do when a subscriber falls behind."""
+
+    DROP_OLDEST = "drop_oldest"
+    LATEST = "latest"
+
+
+@dataclass(frozen=True)
+class GarageUpdate:
+    """Object representing one published change of the garage feed."""
+
+    snapshot: GarageSnapshot
+    changed: tuple[Garage, ...]
+    removed: tuple[str, ...]
+
+    @classmethod
+    def from_snapshots(
+        cls: type[GarageUpdate],
+        previous: GarageSnapshot | None,
+        current: GarageSnapshot,
+    ) -> GarageUpdate:
+        """Return a GarageUpdate object with the difference of two snapshots.
+
+        Args:
+        ----
+            previous: The snapshot that was published before, if any.
+            current: The new snapshot.
+
+        Returns:
+        -------
+            A GarageUpdate object.
+
+        """
+        if previous is None:
+            return cls(snapshot=current, changed=current.garages, removed=())
+        return cls(
+            snapshot=current,
+            changed=tuple(
+                item
+                for item in current.garages
+                if previous.by_id.get(item.garage_id) != item
+            ),
+            removed=tuple(
+                garage_id
+                for garage_id in previous.by_id
+                if garage_id not in current.by_id
+            ),
+        )
+
+    def merge(self, newer: GarageUpdate) -> GarageUpdate:
+        """Coalesce this update with a newer one.
+
+        Args:
+        ----
+            newer: The update that was published after this one.
+
+        Returns:
+        -------
+            A GarageUpdate object covering both updates.
+
+        """
+        changed = {item.garage_id: item for item in self.changed}
+        changed.update((item.garage_id, item) for item in newer.changed)
+        for garage_id in newer.removed:
+            changed.pop(garage_id, None)
+        removed = dict.fromkeys(
+            garage_id for garage_id in self.removed if garage_id not in changed
+        )
+        removed.update(dict.fromkeys(newer.removed))
+        return GarageUpdate(
+            snapshot=newer.snapshot,
+            changed=tuple(changed.values()),
+            removed=tuple(removed),
+        )
+
+
+class GarageSubscription:
+    """Bounded queue of garage updates for a single consumer."""
+
+    def __init__(
+        self,
+        broadcaster: GarageBroadcaster,
+        maxsize: int,
+        policy: BackpressurePolicy,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+        ----
+            broadcaster: The broadcaster that publishes the updates.
+            maxsize: The number of updates that may be pending, ignored for
+                the LATEST policy which always keeps a single update.
+            policy: What to do when the queue is full.
+
+        """
+        if policy is BackpressurePolicy.LATEST:
+            maxsize = 1
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self._broadcaster = broadcaster
+        # The bound is enforced by publish, so the close sentinel always fits.
+        self._queue: asyncio.Queue[GarageUpdate | None] = asyncio.Queue()
+        self._closed = False
+
+    def publish(self, update: GarageUpdate | None) -> None:
+        """Queue an update without ever blocking the broadcaster.
+
+        Args:
+        ----
+            update: The update, or None to signal the end of the feed.
+
+        """
+        if self._closed:
+            return
+        if update is None:
+            self._closed = True
+        elif self._queue.qsize() >= self.maxsize:
+            pending = self._queue.get_nowait()
+            if pending is not None and self.policy is BackpressurePolicy.LATEST:
+                update = pending.merge(update)
+            else:
+                self.dropped += 1
+        self._queue.put_nowait(update)
+
+    async def get(self) -> GarageUpdate:
+        """Wait for the next update.
+
+        Returns
+        -------
+            The next GarageUpdate.
+
+        Raises
+        ------
+            ODPAmsterdamError: When the subscription has been closed.
+
+        """
+        update = await self._queue.get()
+        if update is None:
+            self._queue.put_nowait(None)
+            msg = "The garage subscription has been closed"
+            raise ODPAmsterdamError(msg)
+        return update
+
+    def close(self) -> None:
+        """Stop receiving updates."""
+        self._broadcaster.unsubscribe(self)
+        self.publish(None)
+
+    def __aiter__(self) -> Self:
+        """Return the subscription as async iterator.
+
+        Returns
+        -------
+            The subscription itself.
+
+        """
+        return self
+
+    async def __anext__(self) -> GarageUpdate:
+        """Wait for the next update.
+
+        Returns
+        -------
+            The next GarageUpdate.
+
+        Raises
+        ------
+            StopAsyncIteration: When the subscription has been closed.
+
+        """
+        try:
+            return await self.get()
+        except ODPAmsterdamError:
+            raise StopAsyncIteration from None
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+            The subscription object.
+
+        """
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Async exit.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        self.close()
+
+
+@dataclass
+class GarageBroadcaster:
+    """Poll the garage feed once and fan the updates out to subscribers.
+
+    Every subscriber has its own bounded queue, so a slow consumer only ever
+    loses (or coalesces) its own updates and never stalls the poll loop or
+    the other subscribers. When a scheduler is given, it decides when to
+    poll instead of the fixed interval.
+    """
+
+    client: ODPAmsterdam
+    interval: float = 60.0
+    scheduler: AdaptiveScheduler | None = None
+
+    last_error: Exception | None = field(default=None, init=False)
+
+    _snapshot: GarageSnapshot | None = field(default=None, init=False, repr=False)
+    _subscribers: set[GarageSubscription] = field(
+        default_factory=set, init=False, repr=False
+    )
+    _task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+
+    def subscribe(
+        self,
+        maxsize: int = 16,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+    ) -> GarageSubscription:
+        """Add a subscriber to the broadcaster.
+
+        When a snapshot is already available, the subscriber receives it
+        right away as its first update.
+
+        Args:
+        ----
+            maxsize: The number of updates that may be pending. The LATEST
+                policy ignores it and keeps a single, merged update.
+            policy: What to do when the subscriber falls behind.
+
+        Returns:
+        -------
+            A GarageSubscription object.
+
+        """
+        subscription = GarageSubscription(self, maxsize, policy)
+        if self._snapshot is not None:
+            subscription.publish(GarageUpdate.from_snapshots(None, self._snapshot))
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: GarageSubscription) -> None:
+        """Remove a subscriber from the broadcaster.
+
+        Args:
+        ----
+            subscription: The subscription to remove.
+
+        """
+        self._subscribers.discard(subscription)
+
+    async def poll(self) -> GarageUpdate | None:
+        """Fetch the garage feed and publish the changes.
+
+        Returns
+        -------
+            The published GarageUpdate, or None when nothing changed.
+
+        """
+        snapshot = GarageSnapshot.from_garages(await self.client.all_garages())
+        update = GarageUpdate.from_snapshots(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        if not (update.changed or update.removed):
+            return None
+        for subscription in tuple(self._subscribers):
+            subscription.publish(update)
+        return update
+
+    async def start(self) -> None:
+        """Start the shared poll loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop the poll loop and close all subscriptions."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for subscription in tuple(self._subscribers):
+            subscription.close()
+
+    async def _poll_loop(self) -> None:
+        """Poll on schedule, keeping the loop alive on errors.
+
+        Any error is kept in `last_error` instead of ending the loop, so the
+        subscribers keep receiving updates once the feed recovers.
+        """
+        while True:
+            try:
+                await self.poll()
+                self.last_error = None
+            except Exception as exception:  # noqa: BLE001
+                self.last_error = exception
+                if self.scheduler is not None:
+                    self.scheduler.record_error()
+            else:
+                if self.scheduler is not None and self._snapshot is not None:
+                    self.scheduler.observe(self._snapshot.garages)
+            if self.scheduler is not None:
+                await self.scheduler.wait()
+            else:
+                await asyncio.sleep(self.interval)
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+            The broadcaster object.
+
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Async exit.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        await self.stop()
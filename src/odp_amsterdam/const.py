@@ -39,3 +39,13 @@ CORRECTIONS: list[str] = [
     "P1 ",
     "P3 ",
 ]
+
+REGIME_DAYS: dict[str, int] = {
+    "ma": 0,
+    "di": 1,
+    "wo": 2,
+    "do": 3,
+    "vr": 4,
+    "za": 5,
+    "zo": 6,
+}
@@ -0,0 +1,318 @@
+"""Export parking spots and garages in bulk."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import asdict, fields
+from datetime import date, time
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import ODPAmsterdamError
+from .models import Garage, ParkingSpot
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+    from typing import TextIO
+
+Model = ParkingSpot | Garage
+Records = Iterable[Model] | AsyncIterable[Model]
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+async def iter_batches(
+    records: Records,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[list[Model]]:
+    """Group records into lists of at most `batch_size` items.
+
+    Args:
+    ----
+        records: A list or (async) iterator of ParkingSpot or Garage objects,
+            for example the result of `ODPAmsterdam.stream_locations()`.
+        batch_size: The maximum number of records per batch.
+
+    Yields:
+    ------
+        Lists of records.
+
+    """
+    batch: list[Model] = []
+    if isinstance(records, AsyncIterable):
+        async for item in records:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for item in records:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def to_row(item: Model) -> dict[str, Any]:
+    """Return the fields of a record as a flat dictionary.
+
+    Args:
+    ----
+        item: A ParkingSpot or Garage object.
+
+    Returns:
+    -------
+        A dictionary with one key per field, with the parking regimes
+        converted to dictionaries.
+
+    """
+    row = {field.name: getattr(item, field.name) for field in fields(item)}
+    if isinstance(item, ParkingSpot):
+        row["regimes"] = [asdict(regime) for regime in item.regimes]
+    return row
+
+
+def to_feature(item: Model) -> dict[str, Any]:
+    """Return a record as GeoJSON feature.
+
+    Args:
+    ----
+        item: A ParkingSpot or Garage object.
+
+    Returns:
+    -------
+        A GeoJSON feature dictionary.
+
+    """
+    properties = to_row(item)
+    geometry: dict[str, Any]
+    if isinstance(item, ParkingSpot):
+        del properties["coordinates"]
+        geometry = {"type": "Polygon", "coordinates": [item.coordinates]}
+    else:
+        del properties["longitude"], properties["latitude"]
+        geometry = {"type": "Point", "coordinates": [item.longitude, item.latitude]}
+    return {"type": "Feature", "geometry": geometry, "properties": properties}
+
+
+def json_default(value: Any) -> Any:
+    """Serialize values that are not supported by the json module.
+
+    Args:
+    ----
+        value: The value to serialize.
+
+    Returns:
+    -------
+        A JSON serializable value.
+
+    Raises:
+    ------
+        TypeError: When the value can not be serialized.
+
+    """
+    if isinstance(value, date | time):
+        return value.isoformat()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+async def write_ndjson(
+    records: Records,
+    fp: TextIO,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Write records as newline delimited JSON.
+
+    Args:
+    ----
+        records: A list or (async) iterator of ParkingSpot or Garage objects.
+        fp: A text file object to write to.
+        batch_size: The number of records per write.
+
+    Returns:
+    -------
+        The number of written records.
+
+    """
+    count = 0
+    async for batch in iter_batches(records, batch_size):
+        fp.write(
+            "".join(
+                json.dumps(to_row(item), default=json_default) + "\n" for item in batch
+            )
+        )
+        count += len(batch)
+    return count
+
+
+async def write_geojson(
+    records: Records,
+    fp: TextIO,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Write records as GeoJSON feature collection.
+
+    Args:
+    ----
+        records: A list or (async) iterator of ParkingSpot or Garage objects.
+        fp: A text file object to write to.
+        batch_size: The number of records per write.
+
+    Returns:
+    -------
+        The number of written records.
+
+    """
+    count = 0
+    fp.write('{"type": "FeatureCollection", "features": [')
+    async for batch in iter_batches(records, batch_size):
+        separator = "\n" if count == 0 else ",\n"
+        fp.write(
+            separator
+            + ",\n".join(
+                json.dumps(to_feature(item), default=json_default) for item in batch
+            )
+        )
+        count += len(batch)
+    fp.write("\n]}\n")
+    return count
+
+
+def arrow_schema(model: type[Model]) -> pa.Schema:
+    """Return the Arrow schema of a record type.
+
+    Args:
+    ----
+        model: The ParkingSpot or Garage class.
+
+    Returns:
+    -------
+        A pyarrow schema.
+
+    """
+    _require_pyarrow()
+    if model is ParkingSpot:
+        return pa.schema(
+            [
+                ("spot_id", pa.string()),
+                ("spot_type", pa.string()),
+                ("spot_description", pa.string()),
+                ("street", pa.string()),
+                ("number", pa.int64()),
+                ("orientation", pa.string()),
+                ("coordinates", pa.list_(pa.list_(pa.float64()))),
+                (
+                    "regimes",
+                    pa.list_(
+                        pa.struct(
+                            [
+                                ("spot_type", pa.string()),
+                                ("description", pa.string()),
+                                ("days", pa.list_(pa.int8())),
+                                ("start_time", pa.time32("s")),
+                                ("end_time", pa.time32("s")),
+                                ("start_date", pa.date32()),
+                                ("end_date", pa.date32()),
+                            ]
+                        )
+                    ),
+                ),
+            ]
+        )
+    return pa.schema(
+        [
+            ("garage_id", pa.string()),
+            ("garage_name", pa.string()),
+            ("vehicle", pa.string()),
+            ("category", pa.string()),
+            ("state", pa.string()),
+            ("free_space_short", pa.int64()),
+            ("free_space_long", pa.int64()),
+            ("short_capacity", pa.int64()),
+            ("long_capacity", pa.int64()),
+            ("availability_pct", pa.float64()),
+            ("longitude", pa.float64()),
+            ("latitude", pa.float64()),
+            ("updated_at", pa.timestamp("s", tz="UTC")),
+        ]
+    )
+
+
+async def iter_record_batches(
+    records: Records,
+    model: type[Model],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[pa.RecordBatch]:
+    """Convert records into Arrow record batches.
+
+    Args:
+    ----
+        records: A list or (async) iterator of ParkingSpot or Garage objects.
+        model: The ParkingSpot or Garage class.
+        batch_size: The maximum number of records per batch.
+
+    Yields:
+    ------
+        pyarrow record batches.
+
+    """
+    schema = arrow_schema(model)
+    async for batch in iter_batches(records, batch_size):
+        yield pa.RecordBatch.from_pylist([to_row(item) for item in batch], schema)
+
+
+async def write_parquet(
+    records: Records,
+    where: str | Path,
+    model: type[Model],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Write records to a Parquet file, one row group per batch.
+
+    Args:
+    ----
+        records: A list or (async) iterator of ParkingSpot or Garage objects.
+        where: The path of the Parquet file.
+        model: The ParkingSpot or Garage class.
+        batch_size: The number of records per row group.
+
+    Returns:
+    -------
+        The number of written records.
+
+    """
+    schema = arrow_schema(model)
+    count = 0
+    with pq.ParquetWriter(where, schema) as writer:
+        async for batch in iter_record_batches(records, model, batch_size=batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+def _require_pyarrow() -> None:
+    """Raise an error when pyarrow is not installed.
+
+    Raises
+    ------
+        ODPAmsterdamError: When pyarrow is not installed.
+
+    """
+    if pa is None:  # pragma: no cover
+        msg = "Install pyarrow to export records to Arrow or Parquet"
+        raise ODPAmsterdamError(msg)
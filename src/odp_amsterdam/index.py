@@ -0,0 +1,168 @@
+"""Index of parking spots by the time windows of their regimes."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from .models import ParkingSpot, Regime
+
+TIMEZONE = "Europe/Amsterdam"
+
+Cell = tuple[int, int] | None
+
+
+class RegimeIndex:
+    """Answer which parking spots are valid at a given moment.
+
+    Parking spots share a small number of distinct regimes, so the spots are
+    grouped per regime and per grid cell. A query only checks the regimes
+    that apply on the requested weekday and the cells that overlap the
+    bounding box, instead of every spot.
+    """
+
+    def __init__(
+        self,
+        spots: Iterable[ParkingSpot],
+        cell_size: float = 0.005,
+    ) -> None:
+        """Build the index.
+
+        Args:
+        ----
+            spots: The parking spots to index.
+            cell_size: The size of a grid cell in degrees.
+
+        """
+        self.cell_size = cell_size
+        self.spots: list[ParkingSpot] = []
+        self._centroids: list[tuple[float, float] | None] = []
+        self._days: list[dict[Regime, None]] = [{} for _ in range(7)]
+        self._cells: dict[Regime, dict[Cell, list[int]]] = {}
+
+        for spot in spots:
+            index = len(self.spots)
+            centroid = get_centroid(spot.coordinates)
+            cell = self._cell(*centroid) if centroid is not None else None
+            self.spots.append(spot)
+            self._centroids.append(centroid)
+            for regime in spot.regimes:
+                if regime not in self._cells:
+                    self._cells[regime] = {}
+                    self._add_days(regime)
+                self._cells[regime].setdefault(cell, []).append(index)
+
+    def __len__(self) -> int:
+        """Return the number of indexed parking spots."""
+        return len(self.spots)
+
+    def valid_at(
+        self,
+        moment: datetime,
+        *,
+        spot_type: str | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> list[ParkingSpot]:
+        """Get the parking spots with a regime that applies at a moment.
+
+        Args:
+        ----
+            moment: The moment to check. Naive values are taken as local
+                Amsterdam time, aware values are converted to it.
+            spot_type: Only match regimes of this type (e.g. E6a).
+            bbox: Only return spots whose centroid lies within
+                (min longitude, min latitude, max longitude, max latitude).
+
+        Returns:
+        -------
+            The matching ParkingSpot objects, in the order they were indexed.
+
+        """
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(ZoneInfo(TIMEZONE))
+        cells = self._cells_in(bbox) if bbox is not None else None
+
+        matches: set[int] = set()
+        for regime in self._days[moment.weekday()]:
+            if spot_type is not None and regime.spot_type != spot_type:
+                continue
+            if not regime.is_valid(moment):
+                continue
+            by_cell = self._cells[regime]
+            if cells is None:
+                for indices in by_cell.values():
+                    matches.update(indices)
+                continue
+            for cell in cells & by_cell.keys():
+                matches.update(by_cell[cell])
+
+        if bbox is not None:
+            matches = {index for index in matches if self._within(index, bbox)}
+        return [self.spots[index] for index in sorted(matches)]
+
+    def _add_days(self, regime: Regime) -> None:
+        """List a regime under the weekdays on which it applies.
+
+        An overnight regime also applies in the early hours of the day after
+        each of its days.
+        """
+        overnight = regime.start_time > regime.end_time
+        for day in regime.days:
+            self._days[day][regime] = None
+            if overnight:
+                self._days[(day + 1) % 7][regime] = None
+
+    def _cell(self, longitude: float, latitude: float) -> tuple[int, int]:
+        """Return the grid cell of a coordinate."""
+        return (
+            math.floor(longitude / self.cell_size),
+            math.floor(latitude / self.cell_size),
+        )
+
+    def _cells_in(self, bbox: tuple[float, float, float, float]) -> set[Cell] | None:
+        """Return the grid cells that overlap a bounding box.
+
+        Returns None when the bounding box spans more cells than there are
+        spots, in which case checking every cell is cheaper.
+        """
+        min_x, min_y = self._cell(bbox[0], bbox[1])
+        max_x, max_y = self._cell(bbox[2], bbox[3])
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.spots):
+            return None
+        return {
+            (x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)
+        }
+
+    def _within(self, index: int, bbox: tuple[float, float, float, float]) -> bool:
+        """Return whether the centroid of a spot lies within a bounding box."""
+        centroid = self._centroids[index]
+        if centroid is None:
+            return False
+        longitude, latitude = centroid
+        return bbox[0] <= longitude <= bbox[2] and bbox[1] <= latitude <= bbox[3]
+
+
+def get_centroid(coordinates: list[Any]) -> tuple[float, float] | None:
+    """Get the average position of the points of a parking spot.
+
+    Args:
+    ----
+        coordinates: The polygon ring of the parking spot.
+
+    Returns:
+    -------
+        The longitude and latitude, or None without usable points.
+
+    """
+    points = [point for point in coordinates if isinstance(point, list | tuple)]
+    if not points:
+        return None
+    return (
+        sum(point[0] for point in points) / len(points),
+        sum(point[1] for point in points) / len(points),
+    )
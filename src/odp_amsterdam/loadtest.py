@@ -0,0 +1,157 @@
+"""Load testing driver for the Open Data Platform client."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import ODPAmsterdamError
+from .replay import ReplayServer, synthetic_garages, synthetic_locations
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+@dataclass(frozen=True)
+class LoadTestResult:
+    """Object representing the outcome of a load test."""
+
+    requests: int
+    errors: int
+    duration: float
+    latencies: tuple[float, ...]
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of successful requests per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Return a latency percentile using the nearest-rank method.
+
+        Args:
+        ----
+            pct: The percentile, between 0 and 100.
+
+        Returns:
+        -------
+            The latency in seconds, or 0.0 without successful requests.
+
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def summary(self) -> str:
+        """Return a human readable summary of the result."""
+        return (
+            f"requests={self.requests} errors={self.errors} "
+            f"duration={self.duration:.2f}s "
+            f"throughput={self.throughput:.1f}/s "
+            f"p50={self.percentile(50) * 1000:.1f}ms "
+            f"p90={self.percentile(90) * 1000:.1f}ms "
+            f"p99={self.percentile(99) * 1000:.1f}ms"
+        )
+
+
+async def run_load_test(
+    operation: Callable[[], Awaitable[Any]],
+    *,
+    requests: int = 100,
+    concurrency: int = 10,
+) -> LoadTestResult:
+    """Call an operation many times from a number of concurrent workers.
+
+    Args:
+    ----
+        operation: The coroutine function to measure, e.g. `client.all_garages`.
+        requests: The total number of calls.
+        concurrency: The number of calls in flight at the same time.
+
+    Returns:
+    -------
+        A LoadTestResult object. Calls that raise an ODPAmsterdamError are
+        counted as errors and left out of the latencies.
+
+    """
+    remaining = iter(range(requests))
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                await operation()
+            except ODPAmsterdamError:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return LoadTestResult(
+        requests=requests,
+        errors=errors,
+        duration=time.perf_counter() - started,
+        latencies=tuple(latencies),
+    )
+
+
+async def main(argv: list[str] | None = None) -> LoadTestResult:
+    """Run a load test against a local replay server.
+
+    Args:
+    ----
+        argv: The command line arguments.
+
+    Returns:
+    -------
+        A LoadTestResult object.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", choices=["garages", "locations"], default="garages")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    async with (
+        ReplayServer(
+            garages=synthetic_garages(args.size),
+            locations=synthetic_locations(args.size),
+            latency=args.latency,
+            error_rate=args.error_rate,
+            max_requests_per_second=args.max_rps,
+        ) as server,
+        server.client() as client,
+    ):
+
+        async def operation() -> Any:
+            if args.target == "locations":
+                return await client.locations(limit=args.page_size)
+            return await client.all_garages()
+
+        result = await run_load_test(
+            operation,
+            requests=args.requests,
+            concurrency=args.concurrency,
+        )
+    print(result.summary())  # noqa: T201
+    return result
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
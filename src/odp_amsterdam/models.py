@@ -3,11 +3,209 @@
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import Any
+import json
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime, time, timedelta
+from types import MappingProxyType
+from typing import Any, TypeVar, cast
 
-from .const import CORRECTIONS, FILTER_NAMES, FILTER_UNKNOWN
+from .const import (
+    CORRECTIONS,
+    FILTER_NAMES,
+    FILTER_OUT,
+    FILTER_UNKNOWN,
+    REGIME_DAYS,
+)
+from .exceptions import ODPAmsterdamError
+
+_H = TypeVar("_H", bound=Hashable)
+
+LocationRows = tuple[list[Any], list[tuple[Any, ...]]]
+
+
+def no_intern(value: Any) -> Any:
+    """Return a value as is, used when no symbol table is given.
+
+    Args:
+    ----
+        value: The value.
+
+    Returns:
+    -------
+        The same value.
+
+    """
+    return value
+
+
+class SymbolTable:
+    """Share a single object between equal attribute values.
+
+    Columns like the street name or spot type only have a small number of
+    distinct values across the parking dataset, while the JSON decoder
+    creates a new string for every occurrence. The same goes for the
+    parking regimes, which are shared as a whole.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the symbol table."""
+        self._symbols: dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        """Return the number of distinct values."""
+        return len(self._symbols)
+
+    def intern(self, value: _H | None) -> _H | None:
+        """Return the shared copy of a value.
+
+        Args:
+        ----
+            value: The value to look up.
+
+        Returns:
+        -------
+            The first value seen that is equal to the value, or None.
+
+        """
+        if value is None:
+            return None
+        return cast("_H", self._symbols.setdefault(value, value))
+
+
+@dataclass(frozen=True)
+class Regime:
+    """Object representing a parking regime of a ParkingSpot.
+
+    The days are weekday numbers (Monday is 0) and the times are local
+    Amsterdam times. A regime whose end time lies before its start time
+    runs past midnight, the part after midnight belongs to the day it
+    started on.
+    """
+
+    spot_type: str | None
+    description: str | None
+    days: tuple[int, ...]
+    start_time: time
+    end_time: time
+    start_date: date | None = None
+    end_date: date | None = None
+
+    @classmethod
+    def from_json(
+        cls: type[Regime],
+        data: dict[str, Any],
+        symbols: SymbolTable | None = None,
+    ) -> Regime:
+        """Return Regime object from a dictionary.
+
+        Args:
+        ----
+            data: The JSON data of a single regime from the API.
+            symbols: Symbol table to share repeated values.
+
+        Returns:
+        -------
+            A Regime object.
+
+        """
+        intern = symbols.intern if symbols is not None else no_intern
+        regime = cls(
+            spot_type=intern(data.get("eType") or None),
+            description=intern(data.get("eTypeDescription") or None),
+            days=tuple(
+                REGIME_DAYS[day]
+                for day in data.get("dagen") or []
+                if day in REGIME_DAYS
+            ),
+            start_time=parse_time(data.get("beginTijd")) or time.min,
+            end_time=parse_time(data.get("eindTijd")) or time.max,
+            start_date=parse_date(data.get("beginDatum")),
+            end_date=parse_date(data.get("eindDatum")),
+        )
+        return cast("Regime", intern(regime))
+
+    def covers_time(self, moment: time) -> bool:
+        """Return whether a local time of day falls within the regime.
+
+        Args:
+        ----
+            moment: The local time of day.
+
+        Returns:
+        -------
+            True when the time lies between the start and end time.
+
+        """
+        moment = moment.replace(second=0, microsecond=0)
+        if self.start_time <= self.end_time:
+            return self.start_time <= moment <= self.end_time
+        return moment >= self.start_time or moment <= self.end_time
+
+    def covers_date(self, day: date) -> bool:
+        """Return whether a date falls within the start and end date.
+
+        Args:
+        ----
+            day: The local date.
+
+        Returns:
+        -------
+            True when the regime applies on the date.
+
+        """
+        if self.start_date is not None and day < self.start_date:
+            return False
+        return self.end_date is None or day <= self.end_date
+
+    def is_valid(self, moment: datetime) -> bool:
+        """Return whether the regime applies at a local date and time.
+
+        Args:
+        ----
+            moment: The local date and time.
+
+        Returns:
+        -------
+            True when the regime applies.
+
+        """
+        if not self.covers_time(moment.time()):
+            return False
+        return self.covers_day(self.started_on(moment))
+
+    def covers_day(self, day: date) -> bool:
+        """Return whether the regime starts on a date.
+
+        Args:
+        ----
+            day: The local date.
+
+        Returns:
+        -------
+            True when the weekday is one of the days of the regime and the
+            date falls within the start and end date.
+
+        """
+        return day.weekday() in self.days and self.covers_date(day)
+
+    def started_on(self, moment: datetime) -> date:
+        """Return the date on which the time window around a moment started.
+
+        Args:
+        ----
+            moment: The local date and time, within the time window.
+
+        Returns:
+        -------
+            The date of the moment, or the day before for the part of an
+            overnight regime after midnight.
+
+        """
+        time_of_day = moment.time().replace(second=0, microsecond=0)
+        if self.start_time > self.end_time and time_of_day <= self.end_time:
+            return moment.date() - timedelta(days=1)
+        return moment.date()
 
 
 @dataclass
@@ -24,29 +222,38 @@ class ParkingSpot:
 
     coordinates: list[float]
 
+    regimes: list[Regime] = field(default_factory=list)
+
     @classmethod
-    def from_json(cls: type[ParkingSpot], data: dict[str, Any]) -> ParkingSpot:
+    def from_json(
+        cls: type[ParkingSpot],
+        data: dict[str, Any],
+        symbols: SymbolTable | None = None,
+    ) -> ParkingSpot:
         """Return ParkingSpot object from a dictionary.
 
         Args:
         ----
             data: The JSON data from the API.
+            symbols: Symbol table to share repeated string values.
 
         Returns:
         -------
             An ParkingSpot object.
 
         """
+        intern = symbols.intern if symbols is not None else no_intern
         attr = data["properties"]
         regimes = attr["regimes"][0]
         return cls(
             spot_id=attr["id"],
-            spot_type=attr["eType"] or None,
-            spot_description=regimes["eTypeDescription"] or None,
-            street=filter_unknown(attr["straatnaam"]),
+            spot_type=intern(attr["eType"] or None),
+            spot_description=intern(regimes["eTypeDescription"] or None),
+            street=intern(filter_unknown(attr["straatnaam"])),
             number=int(attr["aantal"]),
-            orientation=filter_unknown(attr["type"]),
+            orientation=intern(filter_unknown(attr["type"])),
             coordinates=data["geometry"]["coordinates"][0],
+            regimes=[Regime.from_json(item, symbols) for item in attr["regimes"]],
         )
 
 
@@ -123,6 +330,291 @@ class Garage:
         )
 
 
+@dataclass(frozen=True)
+class GarageSnapshot:
+    """Immutable view on the garage feed at one point in time."""
+
+    garages: tuple[Garage, ...]
+    by_id: Mapping[str, Garage]
+    fetched_at: datetime
+
+    @classmethod
+    def from_garages(
+        cls: type[GarageSnapshot], garages: list[Garage]
+    ) -> GarageSnapshot:
+        """Return a GarageSnapshot object from a list of garages.
+
+        Args:
+        ----
+            garages: The garages returned by the API.
+
+        Returns:
+        -------
+            A GarageSnapshot object.
+
+        """
+        return cls(
+            garages=tuple(garages),
+            by_id=MappingProxyType({item.garage_id: item for item in garages}),
+            fetched_at=datetime.now(tz=UTC),
+        )
+
+
+def parse_locations(
+    data: str | bytes,
+    symbols: SymbolTable | None = None,
+) -> list[ParkingSpot]:
+    """Decode a parking locations response into ParkingSpot objects.
+
+    This is a module level function so it can be sent to a thread pool. A
+    process pool uses `parse_location_rows` instead.
+
+    Args:
+    ----
+        data: The raw response body from the API.
+        symbols: Symbol table to share repeated string values.
+
+    Returns:
+    -------
+        A list of ParkingSpot objects.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the data is not valid.
+
+    """
+    if symbols is None:
+        symbols = SymbolTable()
+    return [spot_from_feature(item, symbols) for item in load_features(data)]
+
+
+def spot_from_feature(
+    data: dict[str, Any],
+    symbols: SymbolTable | None = None,
+) -> ParkingSpot:
+    """Return a ParkingSpot object from a feature.
+
+    Args:
+    ----
+        data: A single feature from the API.
+        symbols: Symbol table to share repeated string values.
+
+    Returns:
+    -------
+        A ParkingSpot object.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the data is not valid.
+
+    """
+    try:
+        return ParkingSpot.from_json(data, symbols)
+    except (KeyError, IndexError, TypeError, ValueError) as exception:
+        msg = f"Got wrong data from the API: {exception}"
+        raise ODPAmsterdamError(msg) from exception
+
+
+def parse_location_rows(data: str | bytes) -> LocationRows:
+    """Decode a parking locations response into a compact payload.
+
+    This is the process pool variant of `parse_locations`. Each distinct
+    value and regime is stored once in a value list, and the rows refer to
+    it by position, so only a fraction of the objects is pickled back to
+    the parent process. Use `locations_from_rows` to build the models.
+
+    Args:
+    ----
+        data: The raw response body from the API.
+
+    Returns:
+    -------
+        The list of distinct values and one tuple per parking spot.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the data is not valid.
+
+    """
+    positions: dict[Hashable, int] = {}
+
+    def ref(value: Hashable) -> int:
+        return positions.setdefault(value, len(positions))
+
+    rows = [
+        (
+            spot.spot_id,
+            ref(spot.spot_type),
+            ref(spot.spot_description),
+            ref(spot.street),
+            spot.number,
+            ref(spot.orientation),
+            spot.coordinates,
+            tuple(ref(regime) for regime in spot.regimes),
+        )
+        for spot in parse_locations(data)
+    ]
+    return list(positions), rows
+
+
+def locations_from_rows(
+    payload: LocationRows,
+    symbols: SymbolTable | None = None,
+) -> list[ParkingSpot]:
+    """Build ParkingSpot objects from the payload of `parse_location_rows`.
+
+    Args:
+    ----
+        payload: The distinct values and rows from a worker process.
+        symbols: Symbol table to share repeated values with earlier results.
+
+    Returns:
+    -------
+        A list of ParkingSpot objects.
+
+    """
+    values, rows = payload
+    if symbols is not None:
+        values = [
+            symbols.intern(
+                replace(
+                    value,
+                    spot_type=symbols.intern(value.spot_type),
+                    description=symbols.intern(value.description),
+                )
+                if isinstance(value, Regime)
+                else value
+            )
+            for value in values
+        ]
+    return [
+        ParkingSpot(
+            spot_id=spot_id,
+            spot_type=values[spot_type],
+            spot_description=values[description],
+            street=values[street],
+            number=number,
+            orientation=values[orientation],
+            coordinates=coordinates,
+            regimes=[values[regime] for regime in regimes],
+        )
+        for (
+            spot_id,
+            spot_type,
+            description,
+            street,
+            number,
+            orientation,
+            coordinates,
+            regimes,
+        ) in rows
+    ]
+
+
+def parse_garages(data: str | bytes) -> list[Garage]:
+    """Decode a parking garages response into Garage objects.
+
+    This is a module level function so it can be sent to a process pool.
+
+    Args:
+    ----
+        data: The raw response body from the API.
+
+    Returns:
+    -------
+        A list of Garage objects, without the test and dummy garages.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the data is not valid.
+
+    """
+    return [
+        garage
+        for item in load_features(data)
+        if (garage := garage_from_feature(item)) is not None
+    ]
+
+
+def garage_from_feature(data: dict[str, Any]) -> Garage | None:
+    """Return a Garage object from a feature, skipping test and dummy garages.
+
+    Args:
+    ----
+        data: A single feature from the API.
+
+    Returns:
+    -------
+        A Garage object, or None when the garage is filtered out.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the data is not valid.
+
+    """
+    try:
+        if any(x in data["properties"]["Name"] for x in FILTER_OUT):
+            return None
+        return Garage.from_json(data)
+    except (KeyError, TypeError, ValueError) as exception:
+        msg = f"Got wrong data from the API: {exception}"
+        raise ODPAmsterdamError(msg) from exception
+
+
+def parse_garage(data: str | bytes, garage_id: str) -> Garage | None:
+    """Decode a single garage from a parking garages response.
+
+    Args:
+    ----
+        data: The raw response body from the API.
+        garage_id: The ID of the garage.
+
+    Returns:
+    -------
+        The Garage object, or None when the garage is not in the response.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the data is not valid.
+
+    """
+    try:
+        for item in load_features(data):
+            if item["Id"] == garage_id:
+                return Garage.from_json(item)
+    except (KeyError, TypeError, ValueError) as exception:
+        msg = f"Got wrong data from the API: {exception}"
+        raise ODPAmsterdamError(msg) from exception
+    return None
+
+
+def load_features(data: str | bytes) -> list[dict[str, Any]]:
+    """Decode the features of a GeoJSON response.
+
+    Args:
+    ----
+        data: The raw response body from the API.
+
+    Returns:
+    -------
+        The list of features.
+
+    Raises:
+    ------
+        ODPAmsterdamError: If the body is not a GeoJSON feature collection.
+
+    """
+    try:
+        features = json.loads(data)["features"]
+    except (KeyError, TypeError, ValueError) as exception:
+        msg = f"Got wrong data from the API: {exception}"
+        raise ODPAmsterdamError(msg) from exception
+    if not isinstance(features, list):
+        msg = "Got wrong data from the API: features is not a list"
+        raise ODPAmsterdamError(msg)
+    return features
+
+
 def split_coordinates(data: str) -> tuple[float, float]:
     """Split the coordinate data in separate variables.
 
@@ -141,6 +633,48 @@ def split_coordinates(data: str) -> tuple[float, float]:
     return float(latitude), float(longitude)
 
 
+def parse_time(data: str | None) -> time | None:
+    """Try to parse a regime time (e.g. 09:00:00), return None if not possible.
+
+    Args:
+    ----
+        data: The time string from the API.
+
+    Returns:
+    -------
+        The time of day. The value 24:00 is returned as the end of the day.
+
+    """
+    if not data:
+        return None
+    if data.startswith("24:00"):
+        return time.max.replace(second=0, microsecond=0)
+    try:
+        return time.fromisoformat(data)
+    except ValueError:
+        return None
+
+
+def parse_date(data: str | None) -> date | None:
+    """Try to parse a regime date (e.g. 2023-01-31), return None if not possible.
+
+    Args:
+    ----
+        data: The date string from the API.
+
+    Returns:
+    -------
+        The date.
+
+    """
+    if not data:
+        return None
+    try:
+        return date.fromisoformat(data[:10])
+    except ValueError:
+        return None
+
+
 def parse_int(data: str) -> int | None:
     """Try to parse a string to int, return None if not possible."""
     return None if not data or not data.strip().isdigit() else int(data)
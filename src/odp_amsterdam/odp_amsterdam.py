@@ -5,24 +5,46 @@ from __future__ import annotations
 import asyncio
 import json
 import socket
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from importlib import metadata
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self, TypeVar
 
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession
 from aiohttp.hdrs import METH_GET
 from yarl import URL
 
-from .const import FILTER_OUT, PARKING_GARAGE_URL, PARKING_SPOT_URL
+from .const import PARKING_GARAGE_URL, PARKING_SPOT_URL
 from .exceptions import (
     ODPAmsterdamConnectionError,
     ODPAmsterdamError,
     ODPAmsterdamResultsError,
 )
-from .models import Garage, ParkingSpot
+from .models import (
+    ParkingSpot,
+    SymbolTable,
+    garage_from_feature,
+    locations_from_rows,
+    parse_garage,
+    parse_garages,
+    parse_location_rows,
+    parse_locations,
+    spot_from_feature,
+)
+from .streaming import FeatureStreamParser
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from concurrent.futures import Executor
+
+    from .models import Garage
 
 VERSION = metadata.version(__package__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_T = TypeVar("_T")
+
 
 @dataclass
 class ODPAmsterdam:
@@ -30,6 +52,10 @@ class ODPAmsterdam:
 
     request_timeout: float = 15.0
     session: ClientSession | None = None
+    executor: Executor | None = None
+    garage_url: str = PARKING_GARAGE_URL
+    spot_url: str = PARKING_SPOT_URL
+    symbols: SymbolTable = field(default_factory=SymbolTable, repr=False)
 
     _close_session: bool = False
 
@@ -54,6 +80,29 @@ class ODPAmsterdam:
             A Python dictionary (text) with the response from
             the Open Data Platform API of Amsterdam.
 
+        """
+        response = await self._response(url, method=method, params=params)
+        return json.loads(await response.text())
+
+    async def _response(
+        self,
+        url: str,
+        *,
+        method: str = METH_GET,
+        params: dict[str, Any] | None = None,
+    ) -> ClientResponse:
+        """Send a request and validate the response headers.
+
+        Args:
+        ----
+            url: The URL to the Open Data Platform API of Amsterdam.
+            method: HTTP method to use, for example, 'GET'
+            params: Extra options to improve or limit the response.
+
+        Returns:
+        -------
+            The response, with the body not yet read.
+
         Raises:
         ------
             ODPAmsterdamConnectionError: An error occurred while
@@ -100,7 +149,62 @@ class ODPAmsterdam:
                 {"Content-Type": content_type, "response": text},
             )
 
-        return json.loads(await response.text())
+        return response
+
+    async def _parse(self, parser: Callable[..., _T], *args: Any) -> _T:
+        """Run a parser inline or, when configured, in the executor.
+
+        Args:
+        ----
+            parser: A module level function that decodes a response body.
+            args: The arguments for the parser.
+
+        Returns:
+        -------
+            The result of the parser.
+
+        """
+        if self.executor is None:
+            return parser(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parser, *args)
+
+    async def _stream_features(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the features of a response while it is being received.
+
+        Args:
+        ----
+            url: The URL to the Open Data Platform API of Amsterdam.
+            params: Extra options to improve or limit the response.
+
+        Yields:
+        ------
+            The features of the response, one by one.
+
+        Raises:
+        ------
+            ODPAmsterdamConnectionError: An error occurred while
+                reading the response body.
+
+        """
+        response = await self._response(url, params=params)
+        parser = FeatureStreamParser()
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        except ClientError as exception:
+            msg = "Error occurred while reading the Open Data Platform API response."
+            raise ODPAmsterdamConnectionError(msg) from exception
+        finally:
+            response.release()
 
     async def locations(
         self,
@@ -119,11 +223,43 @@ class ODPAmsterdam:
             A list of ParkingSpot objects.
 
         """
-        locations = await self._request(
-            PARKING_SPOT_URL,
+        response = await self._response(
+            self.spot_url,
             params={"_pageSize": limit, "eType": parking_type, "_format": "geojson"},
         )
-        return [ParkingSpot.from_json(item) for item in locations["features"]]
+        body = await response.read()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            # Only send compact rows back, the models are built and interned
+            # through the symbol table of this client.
+            payload = await self._parse(parse_location_rows, body)
+            return locations_from_rows(payload, self.symbols)
+        return await self._parse(parse_locations, body, self.symbols)
+
+    async def stream_locations(
+        self,
+        limit: int = 10,
+        parking_type: str = "",
+    ) -> AsyncIterator[ParkingSpot]:
+        """Get the parking locations while the response is being received.
+
+        Only one feature is held in memory at a time, which keeps the memory
+        usage low for large page sizes.
+
+        Args:
+        ----
+            limit: The number of results to return.
+            parking_type: The selected parking type number.
+
+        Yields:
+        ------
+            ParkingSpot objects, one by one.
+
+        """
+        async for item in self._stream_features(
+            self.spot_url,
+            params={"_pageSize": limit, "eType": parking_type, "_format": "geojson"},
+        ):
+            yield spot_from_feature(item, self.symbols)
 
     async def all_garages(
         self,
@@ -141,16 +277,8 @@ class ODPAmsterdam:
             ODPAmsterdamError: If the data is not valid.
 
         """
-        data = await self._request(PARKING_GARAGE_URL)
-        try:
-            results: list[Garage] = [
-                Garage.from_json(item)
-                for item in data["features"]
-                if not any(x in item["properties"]["Name"] for x in FILTER_OUT)
-            ]
-        except KeyError as exception:
-            msg = f"Got wrong data from the API: {exception}"
-            raise ODPAmsterdamError(msg) from exception
+        response = await self._response(self.garage_url)
+        results = await self._parse(parse_garages, await response.read())
 
         # Filter on vehicle type and category
         if vehicle:
@@ -159,6 +287,33 @@ class ODPAmsterdam:
             results = list(filter(lambda x: x.category == category, results))
         return results
 
+    async def stream_garages(
+        self,
+        vehicle: str | None = None,
+        category: str | None = None,
+    ) -> AsyncIterator[Garage]:
+        """Get all the garages while the response is being received.
+
+        Args:
+        ----
+            vehicle: Only return garages for this vehicle type.
+            category: Only return garages of this category.
+
+        Yields:
+        ------
+            Garage objects, one by one.
+
+        """
+        async for item in self._stream_features(self.garage_url):
+            garage = garage_from_feature(item)
+            if garage is None:
+                continue
+            if vehicle and garage.vehicle != vehicle:
+                continue
+            if category and garage.category != category:
+                continue
+            yield garage
+
     async def garage(self, garage_id: str) -> Garage:
         """Get info from a single  garage.
 
@@ -175,10 +330,10 @@ class ODPAmsterdam:
             ODPAmsterdamResultsError: When no results are found.
 
         """
-        data = await self._request(PARKING_GARAGE_URL)
-        for item in data["features"]:
-            if item["Id"] == garage_id:
-                return Garage.from_json(item)
+        response = await self._response(self.garage_url)
+        garage = await self._parse(parse_garage, await response.read(), garage_id)
+        if garage is not None:
+            return garage
         msg = f"No garage was found with id - {garage_id}"
         raise ODPAmsterdamResultsError(msg)
 
@@ -0,0 +1,331 @@
+"""Local stand-in for the Open Data Platform API of Amsterdam."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from aiohttp import web
+from yarl import URL
+
+from .const import PARKING_GARAGE_URL, PARKING_SPOT_URL
+from .exceptions import ODPAmsterdamError
+from .odp_amsterdam import ODPAmsterdam
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+STREETS: list[str] = [
+    "Akersingel",
+    "Damrak",
+    "Herengracht",
+    "Keizersgracht",
+    "Prinsengracht",
+    "Rokin",
+    "Singel",
+    "Weesperstraat",
+]
+
+SPOT_TYPES: dict[str, str] = {
+    "": "",
+    "E6a": "Gehandicaptenparkeerplaats algemeen",
+    "E6b": "Gehandicaptenparkeerplaats op kenteken",
+    "E7": "Laden en lossen",
+    "E9": "Parkeergelegenheid alleen voor vergunninghouders",
+}
+
+ORIENTATIONS: list[str] = ["Langs", "Visgraat", "File", "Onbekend"]
+
+
+def synthetic_locations(count: int, seed: int = 0) -> dict[str, Any]:
+    """Generate a parkeervakken response with the given number of features.
+
+    Args:
+    ----
+        count: The number of parking locations.
+        seed: The seed for the random generator.
+
+    Returns:
+    -------
+        A GeoJSON feature collection shaped like the real response.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    features = []
+    for index in range(count):
+        e_type = rng.choice(list(SPOT_TYPES))
+        lon = 4.75 + rng.random() * 0.25
+        lat = 52.30 + rng.random() * 0.12
+        ring = [[lon, lat], [lon + 0.00007, lat], [lon + 0.00007, lat + 0.00002]]
+        features.append(
+            {
+                "type": "Feature",
+                "id": f"parkeervakken.{index}",
+                "geometry": {"type": "Polygon", "coordinates": [[*ring, ring[0]]]},
+                "properties": {
+                    "id": str(index),
+                    "straatnaam": rng.choice(STREETS),
+                    "type": rng.choice(ORIENTATIONS),
+                    "eType": e_type,
+                    "aantal": float(rng.randint(1, 4)),
+                    "regimes": [
+                        {
+                            "eType": e_type,
+                            "eTypeDescription": SPOT_TYPES[e_type],
+                            "beginTijd": "00:00:00",
+                            "eindTijd": "23:59:00",
+                            "dagen": ["ma", "di", "wo", "do", "vr", "za", "zo"],
+                        }
+                    ],
+                },
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def synthetic_garages(count: int, seed: int = 0) -> dict[str, Any]:
+    """Generate a parking garages response with the given number of features.
+
+    Args:
+    ----
+        count: The number of garages.
+        seed: The seed for the random generator.
+
+    Returns:
+    -------
+        A GeoJSON feature collection shaped like the real response.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    pub_date = datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    features = []
+    for index in range(count):
+        capacity = rng.randint(50, 2000)
+        features.append(
+            {
+                "type": "Feature",
+                "Id": f"GARAGE-{index:05d}",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [
+                        4.75 + rng.random() * 0.25,
+                        52.30 + rng.random() * 0.12,
+                    ],
+                },
+                "properties": {
+                    "PubDate": pub_date,
+                    "Name": f"CE-P{index:02d} Garage {index}",
+                    "Type": "parkinglocation",
+                    "State": "ok",
+                    "FreeSpaceShort": str(rng.randint(0, capacity)),
+                    "ShortCapacity": str(capacity),
+                    "FreeSpaceLong": "",
+                    "LongCapacity": "",
+                },
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+@dataclass
+class ReplayServer:
+    """Serve recorded or synthetic payloads on the paths of the real API.
+
+    The parking garages feed is served in full, the parking locations are
+    paginated with `_pageSize` and `page` like the real API. Latency, server
+    errors and throttling can be injected to see how the client behaves under
+    realistic conditions.
+    """
+
+    garages: dict[str, Any] = field(default_factory=lambda: synthetic_garages(50))
+    locations: dict[str, Any] = field(default_factory=lambda: synthetic_locations(1000))
+    latency: float = 0.0
+    error_rate: float = 0.0
+    max_requests_per_second: float | None = None
+    host: str = "127.0.0.1"
+    port: int = 0
+    seed: int = 0
+
+    requests: int = field(default=0, init=False)
+
+    _runner: web.AppRunner | None = field(default=None, init=False, repr=False)
+    _url: URL | None = field(default=None, init=False, repr=False)
+    _garages_body: bytes = field(default=b"", init=False, repr=False)
+    _rng: random.Random = field(default_factory=random.Random, init=False, repr=False)
+    _tokens: float = field(default=0.0, init=False, repr=False)
+    _refilled_at: float = field(default=0.0, init=False, repr=False)
+
+    @classmethod
+    def from_files(
+        cls: type[ReplayServer],
+        garages: str | Path,
+        locations: str | Path,
+        **kwargs: Any,
+    ) -> ReplayServer:
+        """Return a ReplayServer object for recorded responses.
+
+        Args:
+        ----
+            garages: Path to a recorded parking garages response.
+            locations: Path to a recorded parkeervakken response.
+            kwargs: Extra options for the server.
+
+        Returns:
+        -------
+            A ReplayServer object.
+
+        """
+        return cls(
+            garages=json.loads(Path(garages).read_text()),
+            locations=json.loads(Path(locations).read_text()),
+            **kwargs,
+        )
+
+    @property
+    def garage_url(self) -> str:
+        """Return the local URL of the parking garages feed."""
+        return str(self._base_url.with_path(URL(PARKING_GARAGE_URL).path))
+
+    @property
+    def spot_url(self) -> str:
+        """Return the local URL of the parking locations feed."""
+        return str(self._base_url.with_path(URL(PARKING_SPOT_URL).path))
+
+    @property
+    def _base_url(self) -> URL:
+        """Return the base URL of the running server."""
+        if self._url is None:
+            msg = "The replay server has not been started"
+            raise ODPAmsterdamError(msg)
+        return self._url
+
+    def client(self, **kwargs: Any) -> ODPAmsterdam:
+        """Return a client that talks to this server.
+
+        Args:
+        ----
+            kwargs: Extra options for the client.
+
+        Returns:
+        -------
+            An ODPAmsterdam object.
+
+        """
+        return ODPAmsterdam(
+            garage_url=self.garage_url,
+            spot_url=self.spot_url,
+            **kwargs,
+        )
+
+    async def start(self) -> None:
+        """Start serving on the configured host and port."""
+        self._rng = random.Random(self.seed)  # noqa: S311
+        self._garages_body = json.dumps(self.garages).encode()
+        self._tokens = self.max_requests_per_second or 0.0
+        self._refilled_at = time.monotonic()
+
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(URL(PARKING_GARAGE_URL).path, self._handle_garages)
+        app.router.add_get(URL(PARKING_SPOT_URL).path, self._handle_locations)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self._url = URL.build(scheme="http", host=host, port=port)
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        """Apply throttling, latency and errors to every request."""
+        self.requests += 1
+        if not self._take_token():
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return web.Response(status=500, text="Injected error")
+        return await handler(request)
+
+    def _take_token(self) -> bool:
+        """Take a token from the rate limit bucket, if there is one."""
+        rate = self.max_requests_per_second
+        if rate is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(rate, self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _handle_garages(self, _: web.Request) -> web.Response:
+        """Serve the parking garages feed."""
+        return web.Response(body=self._garages_body, content_type="application/json")
+
+    async def _handle_locations(self, request: web.Request) -> web.Response:
+        """Serve one page of the parking locations feed."""
+        features = self.locations["features"]
+        if e_type := request.query.get("eType"):
+            features = [
+                item for item in features if item["properties"]["eType"] == e_type
+            ]
+        try:
+            page_size = max(int(request.query.get("_pageSize", 20)), 1)
+            page = max(int(request.query.get("page", 1)), 1)
+        except ValueError:
+            return web.Response(status=400, text="Invalid pagination parameters")
+
+        start = (page - 1) * page_size
+        links: dict[str, Any] = {"self": {"href": str(request.url)}}
+        if start + page_size < len(features):
+            links["next"] = {
+                "href": str(request.url.update_query(page=page + 1)),
+            }
+        body = {
+            "type": "FeatureCollection",
+            "features": features[start : start + page_size],
+            "_links": links,
+        }
+        return web.Response(
+            body=json.dumps(body).encode(),
+            content_type="application/geo+json",
+        )
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+            The replay server object.
+
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Async exit.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        await self.stop()
@@ -0,0 +1,160 @@
+"""Adaptive polling schedule for the parking garages feed."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import Garage
+
+
+@dataclass
+class PollStats:
+    """Object representing the counters of an AdaptiveScheduler.
+
+    `baseline_polls` is the number of polls a fixed interval poller would
+    have made in the time between the first and the last recorded poll.
+    """
+
+    polls: int = 0
+    updates: int = 0
+    stale_polls: int = 0
+    errors: int = 0
+    baseline_polls: float = 0.0
+
+    @property
+    def polls_avoided(self) -> int:
+        """Return how many polls a fixed interval poller would have made more."""
+        return max(0, math.floor(self.baseline_polls) - self.polls)
+
+
+@dataclass
+class AdaptiveScheduler:
+    """Time polls of the garage feed around its learned update cadence.
+
+    The feed is only refreshed periodically, which shows in the `updated_at`
+    (PubDate) of the garages. The scheduler keeps the intervals between the
+    updates it has seen, and plans the next poll `margin` seconds after the
+    next expected update. Polls without new data and errors back off
+    exponentially from `min_interval` up to `max_interval`.
+    """
+
+    default_interval: float = 60.0
+    min_interval: float = 5.0
+    max_interval: float = 900.0
+    margin: float = 5.0
+    history: int = 10
+    baseline_interval: float = 60.0
+
+    stats: PollStats = field(default_factory=PollStats, init=False)
+    last_update: datetime | None = field(default=None, init=False)
+
+    _intervals: deque[float] = field(init=False, repr=False)
+    _failures: int = field(default=0, init=False, repr=False)
+    _last_poll: datetime | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the bounded interval history."""
+        self._intervals = deque(maxlen=self.history)
+
+    @property
+    def cadence(self) -> float | None:
+        """Return the learned time between feed updates in seconds."""
+        if not self._intervals:
+            return None
+        return statistics.median(self._intervals)
+
+    def observe(
+        self,
+        garages: Iterable[Garage],
+        now: datetime | None = None,
+    ) -> bool:
+        """Record the result of a poll.
+
+        Args:
+        ----
+            garages: The garages returned by the poll.
+            now: The time of the poll, defaults to the current UTC time.
+
+        Returns:
+        -------
+            True when the poll returned newer data than before.
+
+        """
+        self._count_poll(now)
+        newest = max((item.updated_at for item in garages), default=None)
+        if newest is None or (
+            self.last_update is not None and newest <= self.last_update
+        ):
+            self.stats.stale_polls += 1
+            self._failures += 1
+            return False
+
+        if self.last_update is not None:
+            self._intervals.append((newest - self.last_update).total_seconds())
+        self.last_update = newest
+        self.stats.updates += 1
+        self._failures = 0
+        return True
+
+    def record_error(self, now: datetime | None = None) -> None:
+        """Record a poll that failed.
+
+        Args:
+        ----
+            now: The time of the poll, defaults to the current UTC time.
+
+        """
+        self._count_poll(now)
+        self.stats.errors += 1
+        self._failures += 1
+
+    def next_delay(self, now: datetime | None = None) -> float:
+        """Get the number of seconds to wait before the next poll.
+
+        Args:
+        ----
+            now: The current time, defaults to the current UTC time.
+
+        Returns:
+        -------
+            The delay in seconds.
+
+        """
+        cadence = self.cadence
+        if self._failures:
+            delay = self.min_interval * 2.0 ** min(self._failures - 1, 32)
+            if cadence is not None:
+                delay = min(delay, cadence)
+        elif cadence is not None and self.last_update is not None:
+            now = now or datetime.now(tz=UTC)
+            elapsed = (now - self.last_update).total_seconds()
+            periods = max(math.floor((elapsed - self.margin) / cadence) + 1, 1)
+            delay = periods * cadence + self.margin - elapsed
+        else:
+            delay = self.default_interval
+
+        return min(max(delay, self.min_interval), self.max_interval)
+
+    async def wait(self) -> None:
+        """Sleep until the next poll is due."""
+        await asyncio.sleep(self.next_delay())
+
+    def _count_poll(self, now: datetime | None) -> None:
+        """Count a poll and the fixed interval polls in the time since the last."""
+        now = now or datetime.now(tz=UTC)
+        if self._last_poll is None:
+            self.stats.baseline_polls += 1
+        else:
+            elapsed = (now - self._last_poll).total_seconds()
+            self.stats.baseline_polls += elapsed / self.baseline_interval
+        self._last_poll = now
+        self.stats.polls += 1
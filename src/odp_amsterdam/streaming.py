@@ -0,0 +1,249 @@
+"""Incremental parsing of GeoJSON feature collections."""
+
+from __future__ import annotations
+
+import codecs
+import enum
+import json
+from typing import Any
+
+from .exceptions import ODPAmsterdamError
+
+WHITESPACE = " \t\n\r"
+
+# Invalid JSON can only be told apart from an incomplete value by waiting for
+# more data, so a single value may not grow beyond this many characters.
+MAX_VALUE_SIZE = 4 * 1024 * 1024
+
+# Returned by the decoder when the buffer ends before the value does.
+_INCOMPLETE = object()
+
+
+class _State(enum.Enum):
+    """Position of the parser within the feature collection."""
+
+    START = enum.auto()
+    KEY = enum.auto()
+    COLON = enum.auto()
+    VALUE = enum.auto()
+    FEATURES = enum.auto()
+    FEATURE = enum.auto()
+    DONE = enum.auto()
+
+
+# Structural characters that must come next, and the state they lead to.
+_EXPECTED: dict[_State, tuple[str, _State]] = {
+    _State.START: ("{", _State.KEY),
+    _State.COLON: (":", _State.VALUE),
+    _State.FEATURES: ("[", _State.FEATURE),
+}
+
+# Characters that close the top level object or the features array.
+_CLOSING: dict[tuple[_State, str], _State] = {
+    (_State.KEY, "}"): _State.DONE,
+    (_State.FEATURE, "]"): _State.KEY,
+}
+
+
+class FeatureStreamParser:
+    """Parse the `features` array of a GeoJSON response chunk by chunk.
+
+    Only the top level object is tracked by the parser itself. Each item of
+    the `features` array is decoded on its own as soon as it is complete, so
+    the buffer never holds much more than a single feature. Other top level
+    members (e.g. `crs` or `_links`) are decoded and discarded.
+    """
+
+    def __init__(self, max_value_size: int = MAX_VALUE_SIZE) -> None:
+        """Initialize the parser.
+
+        Args:
+        ----
+            max_value_size: The maximum size of a single feature or other top
+                level member, in characters.
+
+        """
+        self.max_value_size = max_value_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._key = ""
+        self._final = False
+        self._state = _State.START
+        # Whether the current object or array member is followed by a
+        # separator yet: None right after the opening bracket, True after a
+        # member and False after a comma.
+        self._after_member: bool | None = None
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Feed a chunk of the response body to the parser.
+
+        Args:
+        ----
+            chunk: The next bytes of the response body.
+
+        Returns:
+        -------
+            The features that were completed by this chunk.
+
+        """
+        return self._parse(self._text(chunk))
+
+    def close(self) -> list[dict[str, Any]]:
+        """Signal the end of the response body.
+
+        Returns
+        -------
+            The features that were still waiting for more data.
+
+        Raises
+        ------
+            ODPAmsterdamError: When the response was not a complete
+                feature collection.
+
+        """
+        self._final = True
+        features = self._parse(self._text(b""))
+        if self._state is not _State.DONE:
+            msg = "Got incomplete or invalid JSON data from the API"
+            raise ODPAmsterdamError(msg)
+        return features
+
+    def _text(self, chunk: bytes) -> str:
+        """Decode a chunk, keeping split multi-byte characters for later."""
+        try:
+            return self._decoder.decode(chunk, final=self._final)
+        except UnicodeDecodeError as exception:
+            msg = "Got invalid UTF-8 data from the API"
+            raise ODPAmsterdamError(msg) from exception
+
+    def _parse(self, text: str) -> list[dict[str, Any]]:
+        """Append text to the buffer and consume as many tokens as possible."""
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        features: list[dict[str, Any]] = []
+        while self._step(features):
+            pass
+        return features
+
+    def _decode(self) -> Any:
+        """Decode the JSON value at the current position.
+
+        Returns
+        -------
+            The decoded value, or a sentinel when more data is needed.
+
+        """
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final or len(self._buffer) - self._pos > self.max_value_size:
+                msg = "Got invalid JSON data from the API"
+                raise ODPAmsterdamError(msg) from None
+            return _INCOMPLETE
+        if end == len(self._buffer) and not self._final:
+            # A number could continue in the next chunk.
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _step(self, features: list[dict[str, Any]]) -> bool:
+        """Advance the parser by one token.
+
+        Args:
+        ----
+            features: The list that completed features are appended to.
+
+        Returns:
+        -------
+            Whether the parser can continue without more data.
+
+        Raises:
+        ------
+            ODPAmsterdamError: When the data is not a feature collection.
+
+        """
+        buffer = self._buffer
+        while self._pos < len(buffer) and buffer[self._pos] in WHITESPACE:
+            self._pos += 1
+        if self._pos >= len(buffer):
+            return False
+
+        char = buffer[self._pos]
+        state = self._state
+        if state in (_State.KEY, _State.FEATURE):
+            return self._separator(char, features)
+        if state in _EXPECTED:
+            expected, next_state = _EXPECTED[state]
+            if char != expected:
+                msg = f"Unexpected character in JSON data: {char!r}"
+                raise ODPAmsterdamError(msg)
+            self._pos += 1
+            if state is _State.COLON and self._key == "features":
+                next_state = _State.FEATURES
+            if next_state in (_State.KEY, _State.FEATURE):
+                self._after_member = None
+            self._state = next_state
+            return True
+        if state is _State.DONE:
+            msg = "Unexpected data after the end of the JSON document"
+            raise ODPAmsterdamError(msg)
+
+        # A value of a top level member other than the features.
+        if self._decode() is _INCOMPLETE:
+            return False
+        self._state = _State.KEY
+        self._after_member = True
+        return True
+
+    def _separator(self, char: str, features: list[dict[str, Any]]) -> bool:
+        """Handle a comma, closing bracket or member within the object or array.
+
+        Args:
+        ----
+            char: The next character in the buffer.
+            features: The list that completed features are appended to.
+
+        Returns:
+        -------
+            Whether the parser can continue without more data.
+
+        Raises:
+        ------
+            ODPAmsterdamError: When a separator is missing or misplaced.
+
+        """
+        state = self._state
+        if char == ",":
+            if not self._after_member:
+                msg = "Unexpected ',' in JSON data"
+                raise ODPAmsterdamError(msg)
+            self._pos += 1
+            self._after_member = False
+            return True
+        if (state, char) in _CLOSING:
+            if self._after_member is False:
+                msg = f"Unexpected {char!r} after ',' in JSON data"
+                raise ODPAmsterdamError(msg)
+            self._pos += 1
+            self._state = _CLOSING[state, char]
+            self._after_member = True
+            return True
+        if self._after_member:
+            msg = f"Expected ',' in JSON data, got {char!r}"
+            raise ODPAmsterdamError(msg)
+
+        value = self._decode()
+        if value is _INCOMPLETE:
+            return False
+        if state is _State.KEY:
+            if not isinstance(value, str):
+                msg = "Expected a member name in JSON data"
+                raise ODPAmsterdamError(msg)
+            self._key = value
+            self._state = _State.COLON
+        else:
+            features.append(value)
+            self._after_member = True
+        return True
@@ -0,0 +1,248 @@
+"""Synchronous client for the Open Data Platform of Amsterdam."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from .exceptions import ODPAmsterdamError, ODPAmsterdamResultsError
+from .models import GarageSnapshot
+from .odp_amsterdam import ODPAmsterdam
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from .models import Garage
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class ODPAmsterdamSync:
+    """Synchronous client for the Open Data Platform of Amsterdam.
+
+    A single event loop and client session run in a background thread and
+    refresh the garage feed every `refresh_interval` seconds. Lookups are
+    answered from the latest snapshot, which is swapped atomically, so reads
+    from any number of threads never take a lock or touch the network.
+    Starting, stopping and submitting work to the loop are serialized by a
+    lock, so they are safe to call from any thread as well.
+    """
+
+    refresh_interval: float = 60.0
+    request_timeout: float = 15.0
+
+    last_error: Exception | None = field(default=None, init=False)
+
+    _snapshot: GarageSnapshot | None = field(default=None, init=False, repr=False)
+    _loop: asyncio.AbstractEventLoop | None = field(
+        default=None, init=False, repr=False
+    )
+    _thread: threading.Thread | None = field(default=None, init=False, repr=False)
+    _client: ODPAmsterdam | None = field(default=None, init=False, repr=False)
+    _refresher: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False
+    )
+
+    @property
+    def snapshot(self) -> GarageSnapshot:
+        """Return the latest garage snapshot.
+
+        Returns
+        -------
+            The most recent GarageSnapshot.
+
+        Raises
+        ------
+            ODPAmsterdamError: When the client has not been started yet.
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            msg = "The synchronous client has not been started"
+            raise ODPAmsterdamError(msg)
+        return snapshot
+
+    def start(self) -> None:
+        """Start the background thread and fetch the first snapshot.
+
+        Raises
+        ------
+            ODPAmsterdamError: When the first snapshot could not be fetched.
+
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="odp-amsterdam-sync",
+                daemon=True,
+            )
+            self._thread.start()
+            try:
+                self._run(self._setup())
+            except BaseException:
+                self.stop()
+                raise
+
+    def stop(self) -> None:
+        """Stop the background refresher and close the client session.
+
+        Calls that are still waiting for the background loop, such as a
+        concurrent `refresh()`, are cancelled and raise ODPAmsterdamError.
+        """
+        with self._lock:
+            if self._loop is None or self._thread is None:
+                return
+
+            self._run(self._teardown())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    def refresh(self) -> GarageSnapshot:
+        """Fetch a new snapshot right away, outside the regular schedule.
+
+        Returns
+        -------
+            The freshly fetched GarageSnapshot.
+
+        """
+        return self._run(self._refresh())
+
+    def all_garages(
+        self,
+        vehicle: str | None = None,
+        category: str | None = None,
+    ) -> list[Garage]:
+        """Get all the garages from the latest snapshot.
+
+        Args:
+        ----
+            vehicle: Only return garages for this vehicle type.
+            category: Only return garages of this category.
+
+        Returns:
+        -------
+            A list of Garage objects.
+
+        """
+        results = self.snapshot.garages
+        return [
+            item
+            for item in results
+            if (not vehicle or item.vehicle == vehicle)
+            and (not category or item.category == category)
+        ]
+
+    def garage(self, garage_id: str) -> Garage:
+        """Get info from a single garage from the latest snapshot.
+
+        Args:
+        ----
+            garage_id: The ID of the garage.
+
+        Returns:
+        -------
+            A garage object.
+
+        Raises:
+        ------
+            ODPAmsterdamResultsError: When no results are found.
+
+        """
+        try:
+            return self.snapshot.by_id[garage_id]
+        except KeyError as exception:
+            msg = f"No garage was found with id - {garage_id}"
+            raise ODPAmsterdamResultsError(msg) from exception
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the background loop and wait for the result.
+
+        The coroutine is submitted while holding the lock, so it can not be
+        handed to a loop that is being stopped. Work that is still running
+        when the client stops is cancelled by `_teardown`.
+        """
+        with self._lock:
+            if self._loop is None:
+                coro.close()
+                msg = "The synchronous client has not been started"
+                raise ODPAmsterdamError(msg)
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except CancelledError as exception:
+            msg = "The synchronous client has been stopped"
+            raise ODPAmsterdamError(msg) from exception
+
+    async def _setup(self) -> None:
+        """Create the client session and schedule the refresher."""
+        self._client = ODPAmsterdam(request_timeout=self.request_timeout)
+        await self._refresh()
+        self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def _teardown(self) -> None:
+        """Cancel the refresher and pending calls, and close the client session."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresher = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def _refresh(self) -> GarageSnapshot:
+        """Fetch the garage feed and publish it as the new snapshot."""
+        if self._client is None:
+            msg = "The synchronous client has not been started"
+            raise ODPAmsterdamError(msg)
+        snapshot = GarageSnapshot.from_garages(await self._client.all_garages())
+        self._snapshot = snapshot
+        self.last_error = None
+        return snapshot
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the snapshot on a fixed interval, keeping the last good one.
+
+        Any error is kept in `last_error` instead of ending the loop, so a
+        single bad response never stops the refresher.
+        """
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self._refresh()
+            except Exception as exception:  # noqa: BLE001
+                self.last_error = exception
+
+    def __enter__(self) -> Self:
+        """Enter the context and start the background thread.
+
+        Returns
+        -------
+            The synchronous Open Data Platform Amsterdam object.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Exit the context and stop the background thread.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        self.stop()
@@ -1,9 +1,18 @@
 """Asynchronous Python client providing Open Data information of Amsterdam."""
 
+import json
 from pathlib import Path
 
+from odp_amsterdam import Garage
+
 
 def load_fixtures(filename: str) -> str:
     """Load a fixture."""
     path = Path(__file__).parent / "fixtures" / filename
     return path.read_text()
+
+
+def load_garages() -> list[Garage]:
+    """Load the garage fixture as Garage objects."""
+    data = json.loads(load_fixtures("garages.json"))
+    return [Garage.from_json(item) for item in data["features"]]
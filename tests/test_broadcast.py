@@ -0,0 +1,110 @@
+"""Test the garage broadcaster."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from unittest.mock import AsyncMock
+
+import pytest
+
+from odp_amsterdam import (
+    BackpressurePolicy,
+    Garage,
+    GarageBroadcaster,
+    ODPAmsterdam,
+    ODPAmsterdamConnectionError,
+    ODPAmsterdamError,
+)
+
+from . import load_garages
+
+
+def mock_client(*results: list[Garage]) -> ODPAmsterdam:
+    """Return a client that answers all_garages with the given results."""
+    client = ODPAmsterdam()
+    client.all_garages = AsyncMock(side_effect=results)  # type: ignore[method-assign]
+    return client
+
+
+async def test_diff_updates() -> None:
+    """Test subscribers receive the changes between snapshots."""
+    garages = load_garages()
+    updated = dataclasses.replace(garages[1], free_space_short=1)
+    broadcaster = GarageBroadcaster(
+        mock_client(garages, garages, [garages[0], updated])
+    )
+    subscription = broadcaster.subscribe()
+
+    first = await broadcaster.poll()
+    assert first is not None
+    assert first.changed == tuple(garages)
+    assert await broadcaster.poll() is None
+
+    second = await broadcaster.poll()
+    assert second is not None
+    assert second.changed == (updated,)
+    assert second.removed == tuple(item.garage_id for item in garages[2:])
+
+    assert await subscription.get() is first
+    assert await subscription.get() is second
+
+    late = broadcaster.subscribe()
+    assert (await late.get()).changed == (garages[0], updated)
+
+
+async def test_drop_oldest() -> None:
+    """Test a full queue drops the oldest update."""
+    garages = load_garages()
+    broadcaster = GarageBroadcaster(mock_client(garages[:1], garages[:2], garages[:3]))
+    slow = broadcaster.subscribe(maxsize=2)
+    fast = broadcaster.subscribe(maxsize=2)
+    updates = [await broadcaster.poll() for _ in range(3)]
+    assert slow.dropped == 1
+    assert await slow.get() is updates[1]
+    assert await slow.get() is updates[2]
+    assert fast.policy is BackpressurePolicy.DROP_OLDEST
+
+    # Closing a full queue keeps the pending updates.
+    fast.close()
+    assert fast.dropped == 1
+    assert [update async for update in fast] == updates[1:]
+
+
+async def test_coalesce_latest() -> None:
+    """Test pending updates are coalesced with the latest one."""
+    garages = load_garages()
+    updated = dataclasses.replace(garages[0], free_space_short=1)
+    broadcaster = GarageBroadcaster(
+        mock_client(garages[:2], [updated], [updated, garages[1]])
+    )
+    subscription = broadcaster.subscribe(policy=BackpressurePolicy.LATEST)
+    assert subscription.maxsize == 1
+    for _ in range(3):
+        await broadcaster.poll()
+    update = await subscription.get()
+    assert update.snapshot.garages == (updated, garages[1])
+    assert update.changed == (updated, garages[1])
+    assert update.removed == ()
+    assert subscription.dropped == 0
+
+
+async def test_poll_loop() -> None:
+    """Test the shared poll loop survives errors and closes subscriptions."""
+    garages = load_garages()
+    client = mock_client()
+    client.all_garages.side_effect = [  # type: ignore[attr-defined]
+        ODPAmsterdamConnectionError,
+        ValueError("bad data"),
+        garages,
+        garages,
+    ]
+    async with GarageBroadcaster(client, interval=0.01) as broadcaster:
+        async with broadcaster.subscribe() as subscription:
+            update = await asyncio.wait_for(subscription.get(), timeout=1)
+            assert update.changed == tuple(garages)
+            assert broadcaster.last_error is None
+        with pytest.raises(ODPAmsterdamError):
+            await subscription.get()
+        other = broadcaster.subscribe()
+    assert [update async for update in other] == [update]
@@ -0,0 +1,118 @@
+"""Test the bulk exporters."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING, Any
+
+import pyarrow.parquet as pq
+import pytest
+from aresponses import ResponsesMockServer
+
+from odp_amsterdam import Garage, ODPAmsterdam, ParkingSpot
+from odp_amsterdam.export import (
+    iter_batches,
+    json_default,
+    to_row,
+    write_geojson,
+    write_ndjson,
+    write_parquet,
+)
+from odp_amsterdam.models import Regime, parse_garages, parse_locations
+
+from . import load_fixtures
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def from_row(row: dict[str, Any]) -> ParkingSpot:
+    """Rebuild a ParkingSpot object from an exported row."""
+    regimes = [
+        Regime(**{**regime, "days": tuple(regime["days"])})
+        for regime in row.pop("regimes")
+    ]
+    return ParkingSpot(**row, regimes=regimes)
+
+
+async def test_iter_batches() -> None:
+    """Test records are grouped in bounded batches."""
+    garages = parse_garages(load_fixtures("garages.json"))
+    batches = [batch async for batch in iter_batches(garages, batch_size=4)]
+    assert [len(batch) for batch in batches[:-1]] == [4] * (len(batches) - 1)
+    assert [item for batch in batches for item in batch] == garages
+
+
+async def test_ndjson_from_stream(
+    aresponses: ResponsesMockServer,
+    odp_amsterdam_client: ODPAmsterdam,
+) -> None:
+    """Test parking locations are exported straight from the stream."""
+    aresponses.add(
+        "api.data.amsterdam.nl",
+        "/v1/parkeervakken/parkeervakken",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("parking.json"),
+        ),
+    )
+    fp = io.StringIO()
+    count = await write_ndjson(
+        odp_amsterdam_client.stream_locations(), fp, batch_size=3
+    )
+    rows = [json.loads(line) for line in fp.getvalue().splitlines()]
+    locations = parse_locations(load_fixtures("parking.json"))
+    assert count == len(rows) == len(locations)
+    assert rows == [
+        json.loads(json.dumps(to_row(item), default=json_default)) for item in locations
+    ]
+
+
+async def test_geojson() -> None:
+    """Test garages are exported as feature collection."""
+    garages = parse_garages(load_fixtures("garages.json"))
+    fp = io.StringIO()
+    assert await write_geojson(garages, fp, batch_size=4) == len(garages)
+    features = json.loads(fp.getvalue())["features"]
+    assert len(features) == len(garages)
+    assert features[0]["geometry"] == {
+        "type": "Point",
+        "coordinates": [garages[0].longitude, garages[0].latitude],
+    }
+    assert features[0]["properties"]["updated_at"] == "2023-02-23T13:44:48+00:00"
+
+    fp = io.StringIO()
+    locations = parse_locations(load_fixtures("parking.json"))
+    assert await write_geojson(locations, fp) == len(locations)
+    feature = json.loads(fp.getvalue())["features"][0]
+    assert feature["geometry"]["coordinates"] == [locations[0].coordinates]
+
+    fp = io.StringIO()
+    assert await write_geojson([], fp) == 0
+    assert json.loads(fp.getvalue())["features"] == []
+
+
+def test_json_default() -> None:
+    """Test unsupported values are rejected."""
+    with pytest.raises(TypeError):
+        json_default(object())
+
+
+async def test_parquet(tmp_path: Path) -> None:
+    """Test parking locations and garages are exported to Parquet."""
+    locations = parse_locations(load_fixtures("parking.json"))
+    path = tmp_path / "locations.parquet"
+    assert await write_parquet(locations, path, ParkingSpot, batch_size=4) == 10
+    parquet = pq.ParquetFile(path)
+    assert parquet.num_row_groups == 3
+    assert [from_row(row) for row in parquet.read().to_pylist()] == locations
+
+    garages = parse_garages(load_fixtures("garages.json"))
+    path = tmp_path / "garages.parquet"
+    assert await write_parquet(garages, path, Garage) == len(garages)
+    table = pq.read_table(path)
+    assert table.column("updated_at")[0].as_py() == garages[0].updated_at
+    assert table.column("vehicle").to_pylist() == [item.vehicle for item in garages]
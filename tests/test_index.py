@@ -0,0 +1,183 @@
+"""Test the parking regimes and the regime index."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, date, datetime, time
+from typing import Any
+
+import pytest
+
+from odp_amsterdam import ParkingSpot, Regime, RegimeIndex
+from odp_amsterdam.index import get_centroid
+from odp_amsterdam.models import SymbolTable, parse_locations
+
+from . import load_fixtures
+
+ALL_DAYS = ["ma", "di", "wo", "do", "vr", "za", "zo"]
+
+
+def make_spot(
+    spot_id: str,
+    longitude: float,
+    regimes: list[dict[str, Any]],
+    symbols: SymbolTable,
+) -> ParkingSpot:
+    """Create a parking spot feature with the given regimes."""
+    ring = [[longitude, 52.37], [longitude + 0.0001, 52.37], [longitude, 52.3701]]
+    return ParkingSpot.from_json(
+        {
+            "geometry": {"coordinates": [ring]},
+            "properties": {
+                "id": spot_id,
+                "eType": regimes[0]["eType"],
+                "straatnaam": "Damrak",
+                "aantal": 1.0,
+                "type": "Langs",
+                "regimes": regimes,
+            },
+        },
+        symbols,
+    )
+
+
+@pytest.fixture(name="index")
+def regime_index() -> RegimeIndex:
+    """Regime index fixture with a mix of regimes."""
+    symbols = SymbolTable()
+    disabled = {
+        "eType": "E6a",
+        "eTypeDescription": "Gehandicaptenparkeerplaats algemeen",
+        "beginTijd": "00:00:00",
+        "eindTijd": "23:59:00",
+        "dagen": ALL_DAYS,
+    }
+    loading = {
+        "eType": "E7",
+        "eTypeDescription": "Laden en lossen",
+        "beginTijd": "07:00:00",
+        "eindTijd": "11:00:00",
+        "dagen": ["ma", "di", "wo", "do", "vr"],
+    }
+    night = {
+        "eType": "E9",
+        "eTypeDescription": "Vergunninghouders",
+        "beginTijd": "22:00:00",
+        "eindTijd": "06:00:00",
+        "dagen": ["za"],
+        "beginDatum": "2024-01-01",
+        "eindDatum": "2024-12-31",
+    }
+    spots = [
+        make_spot("disabled-west", 4.80, [disabled], symbols),
+        make_spot("loading-center", 4.89, [loading, disabled], symbols),
+        make_spot("loading-east", 4.95, [loading], symbols),
+        make_spot("night", 4.89, [night], symbols),
+    ]
+    return RegimeIndex(spots)
+
+
+def ids(spots: list[ParkingSpot]) -> list[str]:
+    """Return the ids of parking spots."""
+    return [spot.spot_id for spot in spots]
+
+
+def test_regimes_parsed() -> None:
+    """Test all regimes of a parking spot are kept and shared."""
+    symbols = SymbolTable()
+    locations = parse_locations(load_fixtures("parking.json"), symbols)
+    regime = locations[0].regimes[0]
+    assert regime == Regime(
+        spot_type="E6a",
+        description="Gehandicaptenparkeerplaats algemeen",
+        days=(0, 1, 2, 3, 4, 5, 6),
+        start_time=time(0, 0),
+        end_time=time(23, 59),
+    )
+    assert all(item.regimes[0] is regime for item in locations)
+
+
+def test_regime_edge_values() -> None:
+    """Test missing, invalid and end of day values."""
+    regime = Regime.from_json(
+        {
+            "eType": "",
+            "beginTijd": "bad",
+            "eindTijd": "24:00:00",
+            "beginDatum": "2024-02-30",
+            "eindDatum": "2024-03-01T00:00:00",
+            "dagen": ["ma", "xx"],
+        }
+    )
+    assert regime.spot_type is None
+    assert regime.days == (0,)
+    assert regime.start_time == time.min
+    assert regime.end_time == time(23, 59)
+    assert regime.start_date is None
+    assert regime.end_date == date(2024, 3, 1)
+    assert regime.is_valid(datetime(2024, 2, 26, 23, 59, 30))  # noqa: DTZ001
+    assert not regime.is_valid(datetime(2024, 3, 4, 12, 0))  # noqa: DTZ001
+    assert Regime.from_json({}).days == ()
+
+
+def test_regime_overnight() -> None:
+    """Test the part after midnight belongs to the day the regime started."""
+    regime = Regime.from_json(
+        {"beginTijd": "22:00:00", "eindTijd": "06:00:00", "dagen": ["ma"]}
+    )
+    monday = datetime(2024, 6, 3, 22, 30)  # noqa: DTZ001
+    assert regime.is_valid(monday)
+    assert regime.is_valid(monday.replace(day=4, hour=2))
+    assert regime.is_valid(monday.replace(day=4, hour=6, minute=0, second=30))
+    assert not regime.is_valid(monday.replace(hour=2))
+    assert not regime.is_valid(monday.replace(day=4, hour=22, minute=30))
+    assert regime.started_on(monday.replace(day=4, hour=2)) == date(2024, 6, 3)
+
+
+def test_valid_at(index: RegimeIndex) -> None:
+    """Test spots are found by the time windows of their regimes."""
+    assert len(index) == 4
+    monday_morning = datetime(2024, 6, 3, 8, 30)  # noqa: DTZ001
+    assert ids(index.valid_at(monday_morning)) == [
+        "disabled-west",
+        "loading-center",
+        "loading-east",
+    ]
+    assert ids(index.valid_at(monday_morning, spot_type="E7")) == [
+        "loading-center",
+        "loading-east",
+    ]
+    assert ids(index.valid_at(monday_morning.replace(hour=12), spot_type="E7")) == []
+
+    # The night regime runs from Saturday night into Sunday, and only in 2024.
+    saturday = datetime(2024, 6, 8, 23, 0)  # noqa: DTZ001
+    assert "night" in ids(index.valid_at(saturday))
+    assert "night" in ids(index.valid_at(saturday.replace(day=9, hour=5)))
+    assert "night" not in ids(index.valid_at(saturday.replace(hour=5)))
+    assert "night" not in ids(index.valid_at(saturday.replace(hour=12)))
+    assert "night" not in ids(index.valid_at(saturday.replace(year=2025, day=7)))
+
+    # Aware moments are converted to Amsterdam time (UTC+2 in summer).
+    utc = datetime(2024, 6, 3, 10, 30, tzinfo=UTC)
+    assert ids(index.valid_at(utc, spot_type="E7")) == []
+
+
+def test_valid_at_bbox(index: RegimeIndex) -> None:
+    """Test spots are filtered on a bounding box."""
+    moment = datetime(2024, 6, 3, 8, 30)  # noqa: DTZ001
+    center = (4.88, 52.36, 4.90, 52.38)
+    assert ids(index.valid_at(moment, bbox=center)) == ["loading-center"]
+    everything = (-180.0, -90.0, 180.0, 90.0)
+    assert len(index.valid_at(moment, bbox=everything)) == 3
+    assert index.valid_at(moment, bbox=(0.0, 0.0, 0.001, 0.001)) == []
+
+
+def test_index_without_coordinates() -> None:
+    """Test spots without coordinates are only found without bounding box."""
+    spot = parse_locations(load_fixtures("parking.json"))[0]
+    spot.coordinates = []
+    index = RegimeIndex([spot])
+    moment = datetime(2024, 6, 3, 8, 30)  # noqa: DTZ001
+    assert index.valid_at(moment) == [spot]
+    assert index.valid_at(moment, bbox=(-180.0, -90.0, 180.0, 90.0)) == []
+    assert get_centroid(json.loads("[1.0, 2.0]")) is None
@@ -96,3 +96,43 @@ async def test_parking_locations_model(
     )
     locations: list[ParkingSpot] = await odp_amsterdam_client.locations()
     assert locations == snapshot
+
+
+async def test_parking_locations_interned(
+    aresponses: ResponsesMockServer,
+    odp_amsterdam_client: ODPAmsterdam,
+) -> None:
+    """Test repeated parking location values share one string object."""
+    for _ in range(2):
+        aresponses.add(
+            "api.data.amsterdam.nl",
+            "/v1/parkeervakken/parkeervakken",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/geo+json"},
+                text=load_fixtures("parking.json"),
+            ),
+        )
+    first: list[ParkingSpot] = await odp_amsterdam_client.locations()
+    second: list[ParkingSpot] = [
+        item async for item in odp_amsterdam_client.stream_locations()
+    ]
+    assert first == second
+    assert len({id(item.spot_description) for item in first + second}) == 1
+    assert first[0].street is second[0].street
+    assert first[0].spot_type is second[-1].spot_type
+    assert first[0].regimes[0] is second[-1].regimes[0]
+    values = {
+        value
+        for item in first
+        for value in (
+            item.spot_type,
+            item.spot_description,
+            item.street,
+            item.orientation,
+            *item.regimes,
+        )
+        if value is not None
+    }
+    assert len(odp_amsterdam_client.symbols) == len(values)
@@ -2,6 +2,8 @@
 
 # pylint: disable=protected-access
 import asyncio
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
@@ -9,7 +11,19 @@ from aiohttp import ClientError, ClientResponse, ClientSession
 from aresponses import Response, ResponsesMockServer
 
 from odp_amsterdam import ODPAmsterdam
-from odp_amsterdam.exceptions import ODPAmsterdamConnectionError, ODPAmsterdamError
+from odp_amsterdam.exceptions import (
+    ODPAmsterdamConnectionError,
+    ODPAmsterdamError,
+    ODPAmsterdamResultsError,
+)
+from odp_amsterdam.models import (
+    SymbolTable,
+    locations_from_rows,
+    parse_garage,
+    parse_garages,
+    parse_location_rows,
+    parse_locations,
+)
 
 from . import load_fixtures
 
@@ -103,3 +117,101 @@ async def test_client_error() -> None:
             pytest.raises(ODPAmsterdamConnectionError),
         ):
             assert await client._request("test")
+
+
+async def test_thread_pool_parsing(aresponses: ResponsesMockServer) -> None:
+    """Test parking locations are parsed in a thread pool executor."""
+    aresponses.add(
+        "api.data.amsterdam.nl",
+        "/v1/parkeervakken/parkeervakken",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("parking.json"),
+        ),
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async with ODPAmsterdam(executor=executor) as client:
+            locations = await client.locations()
+    assert locations == parse_locations(load_fixtures("parking.json"))
+    assert len(client.symbols) > 0
+
+
+async def test_process_pool_symbols(aresponses: ResponsesMockServer) -> None:
+    """Test parking locations from a process pool are interned by the client."""
+    aresponses.add(
+        "api.data.amsterdam.nl",
+        "/v1/parkeervakken/parkeervakken",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("parking.json"),
+        ),
+    )
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        async with ODPAmsterdam(executor=executor) as client:
+            locations = await client.locations()
+    assert locations == parse_locations(load_fixtures("parking.json"))
+    assert len(client.symbols) > 0
+    assert locations[0].regimes[0] is locations[1].regimes[0]
+    assert locations[0].regimes[0].description is locations[0].spot_description
+
+
+def test_location_rows() -> None:
+    """Test the compact payload rebuilds the same parking locations."""
+    data = load_fixtures("parking.json")
+    payload = parse_location_rows(data)
+    assert len(pickle.dumps(payload)) < len(pickle.dumps(parse_locations(data)))
+    assert locations_from_rows(payload) == parse_locations(data)
+    assert locations_from_rows(payload, SymbolTable()) == parse_locations(data)
+
+
+async def test_process_pool_parsing(aresponses: ResponsesMockServer) -> None:
+    """Test garages are parsed in a process pool executor."""
+    for _ in range(3):
+        aresponses.add(
+            "p-info.vorin-amsterdam.nl",
+            "/v1/ParkingLocation.json",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "text/plain"},
+                text=load_fixtures("garages.json"),
+            ),
+        )
+    aresponses.add(
+        "p-info.vorin-amsterdam.nl",
+        "/v1/ParkingLocation.json",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            text=load_fixtures("wrong_garages.json"),
+        ),
+    )
+    garages = parse_garages(load_fixtures("garages.json"))
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        async with ODPAmsterdam(executor=executor) as client:
+            assert await client.all_garages() == garages
+            garage = await client.garage(garages[0].garage_id)
+            assert garage == garages[0]
+            with pytest.raises(ODPAmsterdamResultsError):
+                await client.garage("test")
+            with pytest.raises(ODPAmsterdamError):
+                await client.all_garages()
+
+
+@pytest.mark.parametrize(
+    "data",
+    ["not json", b"\xff", "[]", '{"features": {}}', '{"features": [{"Id": "test"}]}'],
+)
+def test_parse_invalid_data(data: str | bytes) -> None:
+    """Test invalid response bodies are reported as ODPAmsterdamError."""
+    with pytest.raises(ODPAmsterdamError):
+        parse_garages(data)
+    with pytest.raises(ODPAmsterdamError):
+        parse_garage(data, "test")
+    with pytest.raises(ODPAmsterdamError):
+        parse_locations(data)
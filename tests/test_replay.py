@@ -0,0 +1,129 @@
+"""Test the replay server and load testing driver."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from odp_amsterdam import ODPAmsterdamConnectionError, ODPAmsterdamError
+from odp_amsterdam.loadtest import LoadTestResult, main, run_load_test
+from odp_amsterdam.replay import (
+    ReplayServer,
+    synthetic_garages,
+    synthetic_locations,
+)
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+async def test_replay_garages() -> None:
+    """Test the client reads garages from the replay server."""
+    async with (
+        ReplayServer(garages=synthetic_garages(250)) as server,
+        server.client() as client,
+    ):
+        garages = await client.all_garages()
+        assert len(garages) == 250
+        garage = await client.garage("GARAGE-00042")
+        assert garage.garage_name == "P42 Garage 42"
+        assert server.requests == 2
+
+
+async def test_replay_pagination() -> None:
+    """Test parking locations are paginated and filtered."""
+    async with (
+        ReplayServer(locations=synthetic_locations(95)) as server,
+        server.client() as client,
+    ):
+        data = await client._request(server.spot_url, params={"_pageSize": 40})
+        assert len(data["features"]) == 40
+        assert "page=2" in data["_links"]["next"]["href"]
+
+        data = await client._request(data["_links"]["next"]["href"])
+        assert len(data["features"]) == 40
+        data = await client._request(data["_links"]["next"]["href"])
+        assert len(data["features"]) == 15
+        assert "next" not in data["_links"]
+
+        locations = await client.locations(limit=100, parking_type="E6a")
+        assert locations
+        assert all(item.spot_type == "E6a" for item in locations)
+
+        with pytest.raises(ODPAmsterdamConnectionError):
+            await client._request(server.spot_url, params={"page": "x"})
+
+
+async def test_replay_from_files() -> None:
+    """Test recorded payloads are replayed."""
+    async with (
+        ReplayServer.from_files(
+            FIXTURES_PATH / "garages.json", FIXTURES_PATH / "parking.json"
+        ) as server,
+        server.client() as client,
+    ):
+        assert len(await client.locations()) == 10
+        assert [item async for item in client.stream_garages()]
+
+
+async def test_replay_errors_and_throttling() -> None:
+    """Test injected errors and throttling surface as connection errors."""
+    async with (
+        ReplayServer(error_rate=1.0) as server,
+        server.client() as client,
+    ):
+        with pytest.raises(ODPAmsterdamConnectionError):
+            await client.all_garages()
+
+    async with (
+        ReplayServer(max_requests_per_second=1) as server,
+        server.client() as client,
+    ):
+        await client.all_garages()
+        with pytest.raises(ODPAmsterdamConnectionError):
+            await client.all_garages()
+
+
+async def test_replay_not_started() -> None:
+    """Test the URLs are only known once the server runs."""
+    server = ReplayServer(garages={}, locations={})
+    with pytest.raises(ODPAmsterdamError):
+        _ = server.garage_url
+    await server.stop()
+
+
+async def test_load_test() -> None:
+    """Test the load test driver reports latencies and errors."""
+    async with (
+        ReplayServer(latency=0.01, error_rate=0.5) as server,
+        server.client() as client,
+    ):
+        result = await run_load_test(client.all_garages, requests=20, concurrency=5)
+    assert result.requests == 20
+    assert 0 < result.errors < 20
+    assert len(result.latencies) == 20 - result.errors
+    assert result.throughput > 0
+    assert result.percentile(50) <= result.percentile(99)
+    assert result.percentile(50) >= 0.01
+
+
+async def test_load_test_cli() -> None:
+    """Test the command line driver."""
+    result = await main(
+        ["--target", "locations", "--size", "50", "--requests", "4"],
+    )
+    assert result.errors == 0
+    assert "p99=" in result.summary()
+
+
+def test_load_test_result_empty() -> None:
+    """Test an empty result."""
+    result = LoadTestResult(requests=0, errors=0, duration=0.0, latencies=())
+    assert result.throughput == 0.0
+    assert result.percentile(99) == 0.0
+
+
+def test_load_test_result_throughput() -> None:
+    """Test failed requests are left out of the throughput."""
+    result = LoadTestResult(requests=4, errors=2, duration=2.0, latencies=(0.1, 0.2))
+    assert result.throughput == 1.0
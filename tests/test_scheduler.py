@@ -0,0 +1,114 @@
+"""Test the adaptive polling scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from odp_amsterdam import (
+    AdaptiveScheduler,
+    Garage,
+    GarageBroadcaster,
+    ODPAmsterdam,
+    ODPAmsterdamConnectionError,
+)
+
+from . import load_fixtures
+
+
+def garages_at(moment: datetime) -> list[Garage]:
+    """Load the garage fixture with a given publication date."""
+    data = json.loads(load_fixtures("garages.json"))
+    return [
+        dataclasses.replace(Garage.from_json(item), updated_at=moment)
+        for item in data["features"]
+    ]
+
+
+START = datetime.fromisoformat("2024-06-03T12:00:00+00:00")
+
+
+def test_learns_cadence() -> None:
+    """Test polls are planned just after the expected feed update."""
+    scheduler = AdaptiveScheduler(margin=5)
+    assert scheduler.next_delay() == scheduler.default_interval
+
+    for minute in (0, 2, 4, 8):
+        assert scheduler.observe(garages_at(START + timedelta(minutes=minute)))
+    # Median of 120, 120 and 240 seconds.
+    assert scheduler.cadence == 120
+
+    last = START + timedelta(minutes=8)
+    assert scheduler.next_delay(last + timedelta(seconds=30)) == 95
+    # Within the margin of the expected update, wait for that update.
+    assert scheduler.next_delay(last + timedelta(seconds=118)) == 7
+    # A missed update is followed by the next expected one.
+    assert scheduler.next_delay(last + timedelta(seconds=150)) == 95
+
+
+def test_backoff() -> None:
+    """Test stale polls and errors back off exponentially."""
+    scheduler = AdaptiveScheduler(min_interval=5, max_interval=30)
+    scheduler.observe(garages_at(START))
+    assert not scheduler.observe(garages_at(START))
+    assert scheduler.next_delay() == 5
+    scheduler.record_error()
+    assert scheduler.next_delay() == 10
+    assert not scheduler.observe([])
+    scheduler.record_error()
+    scheduler.record_error()
+    assert scheduler.next_delay() == 30
+
+    # The backoff never exceeds the learned cadence.
+    scheduler.observe(garages_at(START + timedelta(seconds=20)))
+    for _ in range(50):
+        scheduler.record_error()
+    assert scheduler.next_delay() == 20
+
+    assert scheduler.observe(garages_at(START + timedelta(seconds=40)))
+    assert scheduler.stats.polls == 58
+    assert scheduler.stats.updates == 3
+    assert scheduler.stats.stale_polls == 2
+    assert scheduler.stats.errors == 53
+
+
+def test_polls_avoided() -> None:
+    """Test the polls saved compared to a fixed interval are counted."""
+    scheduler = AdaptiveScheduler(baseline_interval=60, margin=0)
+    for minute in range(0, 50, 5):
+        moment = START + timedelta(minutes=minute)
+        scheduler.observe(garages_at(moment), moment)
+        # Planning a poll does not count towards the statistics.
+        scheduler.next_delay(moment)
+        scheduler.next_delay(moment)
+    # A fixed poller makes 46 polls from minute 0 up to and including 45.
+    assert scheduler.stats.polls == 10
+    assert scheduler.stats.polls_avoided == 36
+    scheduler.record_error(START + timedelta(minutes=47))
+    assert scheduler.stats.polls_avoided == 37
+
+
+async def test_broadcaster_with_scheduler() -> None:
+    """Test the broadcaster polls on the schedule of the scheduler."""
+    client = ODPAmsterdam()
+    scheduler = AdaptiveScheduler(default_interval=0.01, min_interval=0.01)
+    mock = AsyncMock(
+        side_effect=[
+            garages_at(START),
+            ODPAmsterdamConnectionError,
+            garages_at(START),
+            garages_at(START + timedelta(seconds=1)),
+        ]
+        + [garages_at(START + timedelta(seconds=1))] * 100
+    )
+    with patch.object(client, "all_garages", mock):
+        async with GarageBroadcaster(client, scheduler=scheduler) as broadcaster:
+            subscription = broadcaster.subscribe()
+            await asyncio.wait_for(subscription.get(), timeout=1)
+            await asyncio.wait_for(subscription.get(), timeout=1)
+    assert scheduler.stats.errors == 1
+    assert scheduler.stats.updates == 2
+    assert scheduler.cadence == 1
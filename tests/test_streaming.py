@@ -0,0 +1,168 @@
+"""Test the incremental parsing of feature collections."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from odp_amsterdam import ODPAmsterdam, ODPAmsterdamError
+from odp_amsterdam.models import parse_garages, parse_locations
+from odp_amsterdam.streaming import FeatureStreamParser
+
+from . import load_fixtures
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_feature_stream_parser(chunk_size: int) -> None:
+    """Test features are parsed regardless of the chunk boundaries."""
+    body = load_fixtures("parking.json").encode()
+    parser = FeatureStreamParser()
+    features = []
+    for index in range(0, len(body), chunk_size):
+        features.extend(parser.feed(body[index : index + chunk_size]))
+    features.extend(parser.close())
+    assert features == json.loads(body)["features"]
+
+
+def test_feature_stream_parser_trailing_number() -> None:
+    """Test a top level number split over chunks is not cut short."""
+    parser = FeatureStreamParser()
+    assert parser.feed(b'{"features": [{"id": 1}], "count": 1') == [{"id": 1}]
+    assert parser.feed(b"23") == []
+    assert parser.feed(b"}") == []
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"features": [{"id": 1}',
+        b'{"features": [{"id": 1]]}',
+        b'["features"]',
+        b'{"features" [1]}',
+        b'{"features": []} {}',
+        b'{"features": ["\xff"]}',
+        b'{"features": ["\xc3',
+        b'{"features": [1,, 2]}',
+        b'{"features": [, 1]}',
+        b'{"features": [1, ]}',
+        b'{"features": [1 2]}',
+        b'{"a": 1,, "features": []}',
+        b'{, "features": []}',
+        b'{"a": 1 "features": []}',
+        b'{"a": 1, }',
+        b"{1: 2}",
+    ],
+)
+def test_feature_stream_parser_invalid(body: bytes) -> None:
+    """Test invalid or incomplete documents raise an error."""
+    parser = FeatureStreamParser()
+    with pytest.raises(ODPAmsterdamError):
+        _ = [*parser.feed(body), *parser.close()]
+
+
+def test_feature_stream_parser_separators() -> None:
+    """Test empty containers and members around the features are accepted."""
+    parser = FeatureStreamParser()
+    body = b'{"crs": {}, "features": [], "_links": [1, 2]}'
+    assert [*parser.feed(body), *parser.close()] == []
+    parser = FeatureStreamParser()
+    assert [*parser.feed(b"{}"), *parser.close()] == []
+
+
+def test_feature_stream_parser_max_value_size() -> None:
+    """Test invalid data is reported once the buffer exceeds the limit."""
+    parser = FeatureStreamParser(max_value_size=64)
+    assert parser.feed(b'{"features": [{"id": ') == []
+    assert parser.feed(b"x" * 32) == []
+    with pytest.raises(ODPAmsterdamError):
+        parser.feed(b"x" * 32)
+
+
+async def test_stream_locations(
+    aresponses: ResponsesMockServer,
+    odp_amsterdam_client: ODPAmsterdam,
+) -> None:
+    """Test parking locations are streamed from the response."""
+    aresponses.add(
+        "api.data.amsterdam.nl",
+        "/v1/parkeervakken/parkeervakken",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("parking.json"),
+        ),
+    )
+    locations = [item async for item in odp_amsterdam_client.stream_locations()]
+    assert locations == parse_locations(load_fixtures("parking.json"))
+
+
+async def test_stream_garages(
+    aresponses: ResponsesMockServer,
+    odp_amsterdam_client: ODPAmsterdam,
+) -> None:
+    """Test garages are streamed and filtered from the response."""
+    for _ in range(2):
+        aresponses.add(
+            "p-info.vorin-amsterdam.nl",
+            "/v1/ParkingLocation.json",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "text/plain"},
+                text=load_fixtures("garages.json"),
+            ),
+        )
+    garages = parse_garages(load_fixtures("garages.json"))
+    assert [item async for item in odp_amsterdam_client.stream_garages()] == garages
+    assert [
+        item
+        async for item in odp_amsterdam_client.stream_garages(
+            vehicle="car", category="park_and_ride"
+        )
+    ] == [
+        item
+        for item in garages
+        if item.vehicle == "car" and item.category == "park_and_ride"
+    ]
+
+
+async def test_stream_wrong_garages(
+    aresponses: ResponsesMockServer,
+    odp_amsterdam_client: ODPAmsterdam,
+) -> None:
+    """Test a wrong garage model while streaming."""
+    aresponses.add(
+        "p-info.vorin-amsterdam.nl",
+        "/v1/ParkingLocation.json",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            text=load_fixtures("wrong_garages.json"),
+        ),
+    )
+    with pytest.raises(ODPAmsterdamError):
+        _ = [item async for item in odp_amsterdam_client.stream_garages()]
+
+
+async def test_stream_wrong_locations(
+    aresponses: ResponsesMockServer,
+    odp_amsterdam_client: ODPAmsterdam,
+) -> None:
+    """Test a wrong parking location model while streaming."""
+    aresponses.add(
+        "api.data.amsterdam.nl",
+        "/v1/parkeervakken/parkeervakken",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text='{"features": [{"properties": {"id": "1"}}]}',
+        ),
+    )
+    with pytest.raises(ODPAmsterdamError):
+        _ = [item async for item in odp_amsterdam_client.stream_locations()]
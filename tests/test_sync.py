@@ -0,0 +1,169 @@
+"""Test the synchronous client of the Open Data Platform API of Amsterdam."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from odp_amsterdam import (
+    Garage,
+    ODPAmsterdam,
+    ODPAmsterdamConnectionError,
+    ODPAmsterdamError,
+    ODPAmsterdamResultsError,
+    ODPAmsterdamSync,
+)
+
+from . import load_garages
+
+
+def test_snapshot_lookups() -> None:
+    """Test lookups are served from the first snapshot."""
+    garages = load_garages()
+    with (
+        patch.object(ODPAmsterdam, "all_garages", AsyncMock(return_value=garages)),
+        ODPAmsterdamSync(refresh_interval=60) as client,
+    ):
+        assert client.all_garages() == garages
+        assert client.all_garages(vehicle="car", category="park_and_ride") == [
+            item
+            for item in garages
+            if item.vehicle == "car" and item.category == "park_and_ride"
+        ]
+        garage = client.garage(garages[0].garage_id)
+        assert garage is garages[0]
+        with pytest.raises(ODPAmsterdamResultsError):
+            client.garage("test")
+
+
+def test_background_refresh() -> None:
+    """Test the snapshot is replaced by the background refresher."""
+    garages = load_garages()
+    mock = AsyncMock(side_effect=[garages, ODPAmsterdamConnectionError, garages[:1]])
+    with (
+        patch.object(ODPAmsterdam, "all_garages", mock),
+        ODPAmsterdamSync(refresh_interval=0.01) as client,
+    ):
+        first = client.snapshot
+        for _ in range(100):
+            if mock.await_count >= 3:
+                break
+            time.sleep(0.01)
+        assert client.snapshot is not first
+        assert client.all_garages() == garages[:1]
+        assert client.last_error is None
+
+        mock.side_effect = None
+        mock.return_value = garages
+        assert client.refresh().garages == tuple(garages)
+
+
+def test_start_failure() -> None:
+    """Test a failing first fetch stops the background thread."""
+    client = ODPAmsterdamSync()
+    with (
+        patch.object(
+            ODPAmsterdam,
+            "all_garages",
+            AsyncMock(side_effect=ODPAmsterdamConnectionError),
+        ),
+        pytest.raises(ODPAmsterdamConnectionError),
+    ):
+        client.start()
+    with pytest.raises(ODPAmsterdamError):
+        client.all_garages()
+    with pytest.raises(ODPAmsterdamError):
+        client.refresh()
+
+
+def test_refresh_unexpected_error() -> None:
+    """Test the refresher keeps running after an unexpected error."""
+    garages = load_garages()
+    mock = AsyncMock(side_effect=[garages, ValueError("bad data"), garages[:1]])
+    with (
+        patch.object(ODPAmsterdam, "all_garages", mock),
+        ODPAmsterdamSync(refresh_interval=0.01) as client,
+    ):
+        for _ in range(100):
+            if mock.await_count >= 3:
+                break
+            time.sleep(0.01)
+        assert mock.await_count >= 3
+        assert client.all_garages() == garages[:1]
+
+
+def test_start_unexpected_error() -> None:
+    """Test an unexpected error on start leaves the client restartable."""
+    garages = load_garages()
+    client = ODPAmsterdamSync()
+    with (
+        patch.object(
+            ODPAmsterdam,
+            "all_garages",
+            AsyncMock(side_effect=[ValueError("bad data"), garages]),
+        ),
+    ):
+        with pytest.raises(ValueError, match="bad data"):
+            client.start()
+        client.start()
+        try:
+            assert client.all_garages() == garages
+        finally:
+            client.stop()
+
+
+def test_concurrent_start_stop() -> None:
+    """Test starting from many threads runs a single background loop."""
+    garages = load_garages()
+    client = ODPAmsterdamSync()
+    with patch.object(ODPAmsterdam, "all_garages", AsyncMock(return_value=garages)):
+        threads = [threading.Thread(target=client.start) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sync_threads() == 1
+        client.stop()
+    assert sync_threads() == 0
+
+
+def test_stop_cancels_refresh() -> None:
+    """Test a refresh that is still running when stopping is cancelled."""
+    garages = load_garages()
+    calls: list[None] = []
+    started = threading.Event()
+
+    async def slow_garages(_client: ODPAmsterdam) -> list[Garage]:
+        if calls:
+            started.set()
+            await asyncio.sleep(60)
+        calls.append(None)
+        return garages
+
+    errors: list[Exception] = []
+
+    def refresh() -> None:
+        try:
+            client.refresh()
+        except ODPAmsterdamError as exception:
+            errors.append(exception)
+
+    with patch.object(ODPAmsterdam, "all_garages", slow_garages):
+        client = ODPAmsterdamSync()
+        client.start()
+        thread = threading.Thread(target=refresh)
+        thread.start()
+        assert started.wait(timeout=1)
+        client.stop()
+        thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert len(errors) == 1
+
+
+def sync_threads() -> int:
+    """Return the number of running background loop threads."""
+    return sum(thread.name == "odp-amsterdam-sync" for thread in threading.enumerate())